@@ -20,6 +20,7 @@ Examples:
 
 import os
 import sys
+import asyncio
 import json
 import math
 import argparse
@@ -32,11 +33,88 @@ except ImportError:
     print("Error: httpx not installed. Run: pip install httpx")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def parse_json(resp: httpx.Response):
+    """Decode a response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+
+def dump_json(data: dict) -> str:
+    """Serialize a report as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
 
 # =============================================================================
 # GitHub Data Fetcher
 # =============================================================================
 
+GOVERNANCE_FILES = (
+    'GOVERNANCE.md', 'CODE_OF_CONDUCT.md', 'CONTRIBUTING.md',
+    'MAINTAINERS.md', '.github/CODEOWNERS', 'ROADMAP.md'
+)
+CONTENTS_URL = 'https://api.github.com/repos/{owner}/{repo}/contents/'
+
+# Only the counts feed the scores (S1 saturates at 50 commits), so fetch no more
+COMMITS_SAMPLE = 50
+PRS_SAMPLE = 30
+
+ACTIVITY_QUERY = """
+query($owner: String!, $repo: String!, $commits: Int!, $prs: Int!) {
+  repository(owner: $owner, name: $repo) {
+    defaultBranchRef {
+      target {
+        ... on Commit {
+          history(first: $commits) { nodes { committedDate } }
+        }
+      }
+    }
+    pullRequests(first: $prs, orderBy: {field: CREATED_AT, direction: DESC}) {
+      nodes { state }
+    }
+  }
+}
+"""
+
+
+def fetch_activity_graphql(client: httpx.Client, owner: str, repo: str, headers: dict):
+    """
+    Fetch the recent commit and PR samples in a single GraphQL request.
+
+    Only the fields the score calculation needs are requested, which keeps the
+    payload a fraction of the REST list responses. Returns None on failure so
+    the caller can fall back to REST.
+    """
+    resp = client.post(
+        'https://api.github.com/graphql',
+        headers=headers,
+        json={
+            'query': ACTIVITY_QUERY,
+            'variables': {'owner': owner, 'repo': repo, 'commits': COMMITS_SAMPLE, 'prs': PRS_SAMPLE},
+        }
+    )
+    if resp.status_code != 200:
+        return None
+
+    payload = parse_json(resp)
+    repository = (payload.get('data') or {}).get('repository')
+    if payload.get('errors') or not repository:
+        return None
+
+    target = (repository.get('defaultBranchRef') or {}).get('target') or {}
+    commits = (target.get('history') or {}).get('nodes', [])
+    prs = repository['pullRequests']['nodes']
+    return commits, prs
+
+
 def fetch_github_data(owner: str, repo: str, token: str = None) -> dict:
     """Fetch project data from GitHub API."""
     headers = {'Accept': 'application/vnd.github.v3+json'}
@@ -57,41 +135,38 @@ def fetch_github_data(owner: str, repo: str, token: str = None) -> dict:
         if repo_resp.status_code == 403:
             print("Error: GitHub API rate limit exceeded. Set GITHUB_TOKEN environment variable.")
             sys.exit(1)
-        repo_data = repo_resp.json()
+        repo_data = parse_json(repo_resp)
 
         # Contributors
         contrib_resp = client.get(
             f'https://api.github.com/repos/{owner}/{repo}/contributors',
             headers=headers, params={'per_page': 30}
         )
-        contributors = contrib_resp.json() if contrib_resp.status_code == 200 else []
-
-        # Commits
-        commits_resp = client.get(
-            f'https://api.github.com/repos/{owner}/{repo}/commits',
-            headers=headers, params={'per_page': 50}
-        )
-        commits = commits_resp.json() if commits_resp.status_code == 200 else []
+        contributors = parse_json(contrib_resp) if contrib_resp.status_code == 200 else []
+
+        # Commits and pull requests (GraphQL needs a token)
+        activity = fetch_activity_graphql(client, owner, repo, headers) if token else None
+        if activity:
+            commits, prs = activity
+        else:
+            commits_resp = client.get(
+                f'https://api.github.com/repos/{owner}/{repo}/commits',
+                headers=headers, params={'per_page': COMMITS_SAMPLE}
+            )
+            commits = parse_json(commits_resp) if commits_resp.status_code == 200 else []
 
-        # Pull requests
-        prs_resp = client.get(
-            f'https://api.github.com/repos/{owner}/{repo}/pulls',
-            headers=headers, params={'state': 'all', 'per_page': 30}
-        )
-        prs = prs_resp.json() if prs_resp.status_code == 200 else []
+            prs_resp = client.get(
+                f'https://api.github.com/repos/{owner}/{repo}/pulls',
+                headers=headers, params={'state': 'all', 'per_page': PRS_SAMPLE}
+            )
+            prs = parse_json(prs_resp) if prs_resp.status_code == 200 else []
 
         # Governance files
-        gov_files = {}
-        files_to_check = [
-            'GOVERNANCE.md', 'CODE_OF_CONDUCT.md', 'CONTRIBUTING.md',
-            'MAINTAINERS.md', '.github/CODEOWNERS', 'ROADMAP.md'
-        ]
-        for f in files_to_check:
-            resp = client.get(
-                f'https://api.github.com/repos/{owner}/{repo}/contents/{f}',
-                headers=headers
-            )
-            gov_files[f] = resp.status_code == 200
+        contents_url = CONTENTS_URL.format(owner=owner, repo=repo)
+        gov_files = {
+            f: client.get(contents_url + f, headers=headers).status_code == 200
+            for f in GOVERNANCE_FILES
+        }
 
         return {
             'repository': repo_data,
@@ -244,6 +319,12 @@ RISK_COLORS = {
     'CRITICAL': '#e74c3c'
 }
 
+# Unit-circle vertices for the 5-axis radar (S1 at the top, clockwise)
+RADAR_UNIT_POINTS = tuple(
+    (math.cos(math.radians(i * 72 - 90)), math.sin(math.radians(i * 72 - 90)))
+    for i in range(5)
+)
+
 
 def generate_simple_badge(report: dict) -> str:
     """Generate shields.io style badge."""
@@ -362,14 +443,10 @@ def generate_mini_card(report: dict, theme: str = 'dark') -> str:
     # Radar points
     cx, cy, r = 45, 45, 25
     scores = [report['subsystems'][s]['score'] for s in ['S1', 'S2', 'S3', 'S4', 'S5']]
-    points = []
-    for i, score in enumerate(scores):
-        angle = (i * 72 - 90) * math.pi / 180
-        point_r = r * (score / 100)
-        x = cx + point_r * math.cos(angle)
-        y = cy + point_r * math.sin(angle)
-        points.append(f"{x},{y}")
-    points_str = " ".join(points)
+    points_str = " ".join(
+        f"{cx + r * score / 100 * ux},{cy + r * score / 100 * uy}"
+        for score, (ux, uy) in zip(scores, RADAR_UNIT_POINTS)
+    )
 
     return f'''<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">
   <rect width="{width}" height="{height}" rx="8" fill="{bg_color}" stroke="{border_color}" stroke-width="1"/>
@@ -386,6 +463,25 @@ def generate_mini_card(report: dict, theme: str = 'dark') -> str:
 </svg>'''
 
 
+# =============================================================================
+# Output Writers
+# =============================================================================
+
+def write_atomic(path: Path, content: str) -> None:
+    """Write a file via temp file + rename so readers never see a partial file."""
+    tmp_path = path.with_name(f'.{path.name}.tmp')
+    tmp_path.write_text(content)
+    os.replace(tmp_path, path)
+
+
+async def write_outputs(outputs: dict) -> None:
+    """Write all generated files in parallel worker threads."""
+    await asyncio.gather(*(
+        asyncio.to_thread(write_atomic, path, content)
+        for path, content in outputs.items()
+    ))
+
+
 # =============================================================================
 # Main
 # =============================================================================
@@ -440,38 +536,26 @@ Environment Variables:
     output_dir = Path(args.output)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Generate and save badges
+    # Generate badges
     safe_name = args.repository.replace('/', '_')
-
-    # Simple badge
-    badge = generate_simple_badge(report)
     badge_path = output_dir / f'{safe_name}_badge.svg'
-    badge_path.write_text(badge)
-    if not args.quiet:
-        print(f"\nSaved: {badge_path}")
-
-    # Detailed card
-    card = generate_detailed_card(report, args.theme)
-    card_path = output_dir / f'{safe_name}_card.svg'
-    card_path.write_text(card)
-    if not args.quiet:
-        print(f"Saved: {card_path}")
-
-    # Mini card
-    mini = generate_mini_card(report, args.theme)
-    mini_path = output_dir / f'{safe_name}_mini.svg'
-    mini_path.write_text(mini)
-    if not args.quiet:
-        print(f"Saved: {mini_path}")
+    outputs = {
+        badge_path: generate_simple_badge(report),
+        output_dir / f'{safe_name}_card.svg': generate_detailed_card(report, args.theme),
+        output_dir / f'{safe_name}_mini.svg': generate_mini_card(report, args.theme),
+    }
 
     # JSON report
     if args.json:
-        json_path = output_dir / f'{safe_name}_report.json'
-        json_path.write_text(json.dumps(report, indent=2))
-        if not args.quiet:
-            print(f"Saved: {json_path}")
+        outputs[output_dir / f'{safe_name}_report.json'] = dump_json(report)
+
+    # Save all files concurrently
+    asyncio.run(write_outputs(outputs))
 
     if not args.quiet:
+        print()
+        for path in outputs:
+            print(f"Saved: {path}")
         print(f"\nTo embed in README:")
         print(f"  ![VSM Health]({badge_path})")
 
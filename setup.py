@@ -59,5 +59,11 @@ setup(
             "ipywidgets>=8.1.0",
             "plotly>=5.18.0",
         ],
+        "performance": [
+            "numba>=0.58.0",
+            "orjson>=3.9.0",
+            "ciso8601>=2.3.0",
+            "httpx[http2]>=0.25.0",
+        ],
     },
 )
@@ -3,9 +3,98 @@ Entropy Calculation Module
 Calculates organizational entropy across multiple dimensions.
 """
 
+import math
+import re
+from functools import lru_cache
 import numpy as np
-from typing import List, Dict, Any
-from scipy.stats import entropy as scipy_entropy
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+NUMBA_AVAILABLE = njit is not None
+
+# ISO-8601 timestamp prefix, capturing the hour (e.g. "2024-01-15T13:45:00Z")
+ISO_HOUR_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}T([01]\d|2[0-3]):')
+
+# Inner edges of the commit size categories used by file_change_entropy
+CHANGE_SIZE_EDGES = np.array([10, 50, 200, 1000])
+
+# k * log₂(k) for small integer histogram counts (0 * log₂(0) taken as 0)
+K_LOG2_K = np.arange(4096) * np.log2(np.maximum(np.arange(4096), 1))
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(fastmath=True, cache=True)
+    def shannon_entropy_nb(probabilities: np.ndarray) -> float:
+        """Shannon entropy in bits, skipping zero probabilities without a masked copy."""
+        h = 0.0
+        for i in range(probabilities.shape[0]):
+            p = probabilities[i]
+            if p > 0.0:
+                h -= p * math.log2(p)
+        return h
+
+    @njit(fastmath=True, cache=True)
+    def gini_sorted_nb(sorted_values: np.ndarray) -> float:
+        """Gini coefficient of an ascending-sorted array, ignoring non-positive values."""
+        n = 0
+        total = 0.0
+        weighted_sum = 0.0
+        for i in range(sorted_values.shape[0]):
+            x = sorted_values[i]
+            if x > 0.0:
+                n += 1
+                total += x
+                weighted_sum += n * x
+        if n == 0:
+            return 0.0
+        return 2.0 * weighted_sum / (n * total) - (n + 1.0) / n
+
+
+@lru_cache(maxsize=4096)
+def _cached_histogram_entropy(counts: bytes) -> float:
+    """Shannon entropy of an int64 histogram given as raw bytes (memoized)."""
+    hist = np.frombuffer(counts, dtype=np.int64)
+    total = hist.sum()
+    if total == 0:
+        return 0.0
+
+    if hist.max() < len(K_LOG2_K):
+        weighted_sum = K_LOG2_K[hist].sum()
+    else:
+        # Rare very large bins: fall back to computing k * log₂(k) directly
+        positive = hist[hist > 0].astype(np.float64)
+        weighted_sum = np.dot(positive, np.log2(positive))
+
+    return max(0.0, math.log2(total) - weighted_sum / total)
+
+
+@dataclass
+class ContributorStats:
+    """Contribution counts extracted once and shared by entropy, Gini and classification."""
+    sorted_contributions: np.ndarray  # Ascending
+    total: float
+    count: int
+
+    @classmethod
+    def from_contributors(cls, contributor_data: List[Dict[str, Any]]) -> 'ContributorStats':
+        # Stream counts straight into a preallocated array (no intermediate list)
+        contributions = np.fromiter(
+            (c.get('contributions', 0) for c in contributor_data),
+            dtype=np.float64,
+            count=len(contributor_data)
+        )
+        contributions.sort()
+        return cls(
+            sorted_contributions=contributions,
+            total=contributions.sum(),
+            count=len(contributor_data)
+        )
 
 
 class EntropyCalculator:
@@ -24,11 +113,18 @@ class EntropyCalculator:
         Returns:
             Shannon entropy value
         """
-        # Filter out zero probabilities
-        p = probabilities[probabilities > 0]
-        return -np.sum(p * np.log2(p))
-
-    def contributor_entropy(self, contributor_data: List[Dict[str, Any]]) -> tuple:
+        if NUMBA_AVAILABLE:
+            return shannon_entropy_nb(np.asarray(probabilities, dtype=np.float64))
+
+        # Zero probabilities are skipped by log₂'s where= (their terms stay 0)
+        # instead of copying the positive entries out. float64 like the numba
+        # kernel, so results don't depend on which path runs.
+        p = np.asarray(probabilities, dtype=np.float64)
+        log_p = np.log2(p, out=np.zeros_like(p), where=p > 0)
+        return -np.sum(p * log_p)
+
+    def contributor_entropy(self, contributor_data: List[Dict[str, Any]],
+                            stats: Optional[ContributorStats] = None) -> tuple:
         """
         Calculate contributor entropy from contribution distribution.
 
@@ -36,6 +132,7 @@ class EntropyCalculator:
 
         Args:
             contributor_data: List of dictionaries with 'login' and 'contributions' keys
+            stats: Precomputed ContributorStats for contributor_data (optional)
 
         Returns:
             Tuple of (entropy, normalized_entropy)
@@ -43,21 +140,31 @@ class EntropyCalculator:
         if not contributor_data:
             return 0.0, 0.0
 
-        # Extract contribution counts
-        contributions = np.array([c.get('contributions', 0) for c in contributor_data])
-        total = contributions.sum()
+        if stats is None:
+            stats = ContributorStats.from_contributors(contributor_data)
+
+        return self._entropy_from_stats(stats)
+
+    @staticmethod
+    def _entropy_from_stats(stats: ContributorStats) -> tuple:
+        """Calculate (entropy, normalized_entropy) from precomputed contributor stats."""
+        return EntropyCalculator._entropy_from_counts(
+            stats.sorted_contributions, stats.total, stats.count
+        )
 
+    @staticmethod
+    def _entropy_from_counts(contributions: np.ndarray, total: float, count: int) -> tuple:
+        """Calculate (entropy, normalized_entropy) from contribution counts in any order."""
         if total == 0:
             return 0.0, 0.0
 
-        # Calculate probability distribution
-        probabilities = contributions / total
-
-        # Calculate entropy
-        entropy = self.shannon_entropy(probabilities)
+        # Calculate entropy straight from counts: H = log₂(T) - Σ c * log₂(c) / T
+        # (equivalent to -Σ (c/T) * log₂(c/T) without building the probabilities array)
+        counts = contributions[contributions > 0]
+        entropy = max(0.0, math.log2(total) - np.dot(counts, np.log2(counts)) / total)
 
         # Calculate normalized entropy (0 = concentrated, 1 = uniform)
-        max_entropy = np.log2(len(contributor_data))
+        max_entropy = math.log2(count)
         normalized_entropy = entropy / max_entropy if max_entropy > 0 else 0.0
 
         return entropy, normalized_entropy
@@ -79,22 +186,88 @@ class EntropyCalculator:
         if not values or len(values) == 0:
             return 0.0
 
-        values = np.array(values, dtype=float)
-        values = values[values > 0]  # Remove zeros
+        return EntropyCalculator._gini_from_sorted(np.sort(np.array(values, dtype=float)))
+
+    @staticmethod
+    def _gini_from_sorted(sorted_values: np.ndarray) -> float:
+        """Calculate Gini coefficient from values already sorted in ascending order."""
+        if NUMBA_AVAILABLE:
+            return gini_sorted_nb(sorted_values)
+
+        # Zeros (and any negatives) sort first, so slice them off instead of masking
+        sorted_values = sorted_values[np.searchsorted(sorted_values, 0, side='right'):]
 
-        if len(values) == 0:
+        if len(sorted_values) == 0:
             return 0.0
 
-        # Sort values
-        sorted_values = np.sort(values)
-        n = len(sorted_values)
+        n = sorted_values.size
+        cumulative = np.cumsum(sorted_values)
+        total = cumulative[-1]
 
-        # Calculate Gini using the formula: G = (2 * Σ(i * x_i) - (n + 1) * Σx_i) / (n * Σx_i)
-        cumulative_sum = np.cumsum(sorted_values)
-        gini = (2 * np.sum(np.arange(1, n + 1) * sorted_values) - (n + 1) * cumulative_sum[-1]) / (n * cumulative_sum[-1])
+        # Rank formula G = 2 * Σ(i * x_i) / (n * Σx_i) - (n + 1) / n, with the rank
+        # weights taken from the running sums: Σ(i * x_i) = (n + 1) * T - Σ cumsum(x)
+        gini = ((n + 1) * total - 2 * cumulative.sum()) / (n * total)
 
         return gini
 
+    @staticmethod
+    def _extract_commit_features(commit_data: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Extract commit hours and change sizes in a single pass.
+
+        Args:
+            commit_data: List of commit dictionaries
+
+        Returns:
+            Tuple of (hours, changes). Hours only include commits with a
+            well-formed ISO-8601 'date'; changes include every commit.
+        """
+        hours = []
+        changes = []
+        for commit in commit_data:
+            date = commit.get('date')
+            match = ISO_HOUR_PATTERN.match(date) if isinstance(date, str) else None
+            if match:
+                hours.append(match.group(1))
+            changes.append(commit.get('additions', 0) + commit.get('deletions', 0))
+
+        # Convert the two-digit hour strings to integers in one NumPy call
+        return np.array(hours, dtype=np.int64), np.array(changes)
+
+    @staticmethod
+    def _histogram_entropy(hist: np.ndarray) -> float:
+        """
+        Calculate Shannon entropy of an integer histogram.
+
+        Uses H = log₂(T) - Σ k * log₂(k) / T with k * log₂(k) read from a
+        lookup table, so no probabilities array or per-bin log₂ is needed.
+        Results are memoized on the raw counts, since many projects produce
+        identical small histograms.
+        """
+        return _cached_histogram_entropy(hist.astype(np.int64, copy=False).tobytes())
+
+    def _temporal_entropy_from_hours(self, hours: np.ndarray, bins: int = 24) -> float:
+        """Calculate temporal entropy from an array of commit hours."""
+        if len(hours) == 0:
+            return 0.0
+
+        # Hours are integers in [0, 24), so count them per bin directly
+        # (same bins as np.histogram(hours, bins=bins, range=(0, 24)))
+        hist = np.bincount(hours * bins // 24, minlength=bins)
+
+        return self._histogram_entropy(hist)
+
+    def _change_entropy_from_changes(self, changes: np.ndarray) -> float:
+        """Calculate file change entropy from an array of change sizes."""
+        if len(changes) == 0 or changes.sum() == 0:
+            return 0.0
+
+        # Bin changes into size categories: [0, 10), [10, 50), [50, 200), [200, 1000), [1000, ∞)
+        bin_index = np.searchsorted(CHANGE_SIZE_EDGES, changes, side='right')
+        hist = np.bincount(bin_index, minlength=len(CHANGE_SIZE_EDGES) + 1)
+
+        return self._histogram_entropy(hist)
+
     def commit_temporal_entropy(self, commit_data: List[Dict[str, Any]], bins: int = 24) -> float:
         """
         Calculate temporal entropy from commit time distribution.
@@ -109,26 +282,8 @@ class EntropyCalculator:
         if not commit_data:
             return 0.0
 
-        # Extract hour of day from commits
-        from datetime import datetime
-        hours = []
-        for commit in commit_data:
-            try:
-                dt = datetime.fromisoformat(commit['date'].replace('Z', '+00:00'))
-                hours.append(dt.hour)
-            except:
-                continue
-
-        if not hours:
-            return 0.0
-
-        # Create histogram
-        hist, _ = np.histogram(hours, bins=bins, range=(0, 24))
-
-        # Calculate probabilities
-        probabilities = hist / hist.sum()
-
-        return self.shannon_entropy(probabilities)
+        hours, _ = self._extract_commit_features(commit_data)
+        return self._temporal_entropy_from_hours(hours, bins)
 
     def file_change_entropy(self, commit_data: List[Dict[str, Any]]) -> float:
         """
@@ -146,23 +301,8 @@ class EntropyCalculator:
         if not commit_data:
             return 0.0
 
-        # Calculate change distribution (additions + deletions)
-        changes = np.array([
-            c.get('additions', 0) + c.get('deletions', 0)
-            for c in commit_data
-        ])
-
-        if changes.sum() == 0:
-            return 0.0
-
-        # Bin changes into categories
-        bins = [0, 10, 50, 200, 1000, np.inf]
-        hist, _ = np.histogram(changes, bins=bins)
-
-        # Calculate probabilities
-        probabilities = hist / hist.sum()
-
-        return self.shannon_entropy(probabilities)
+        _, changes = self._extract_commit_features(commit_data)
+        return self._change_entropy_from_changes(changes)
 
     def calculate_all_entropy_measures(self, project_data: Dict[str, Any]) -> Dict[str, float]:
         """
@@ -175,22 +315,21 @@ class EntropyCalculator:
             Dictionary of entropy measures
         """
         contributors = project_data.get('contributors', [])
-        entropy, normalized_entropy = self.contributor_entropy(contributors)
 
-        # Calculate Gini coefficient
-        contributions = [c.get('contributions', 0) for c in contributors]
-        gini = self.gini_coefficient(contributions)
+        # Extract and sort contribution counts once for entropy and Gini
+        stats = ContributorStats.from_contributors(contributors)
+        entropy, normalized_entropy = self._entropy_from_stats(stats)
+        gini = self._gini_from_sorted(stats.sorted_contributions)
+
+        # Walk the commit list once for both commit-based measures
+        hours, changes = self._extract_commit_features(project_data.get('recent_commits', []))
 
         return {
             "contributor_entropy": entropy,
             "contributor_entropy_normalized": normalized_entropy,
             "contributor_gini": gini,
-            "temporal_entropy": self.commit_temporal_entropy(
-                project_data.get('recent_commits', [])
-            ),
-            "change_entropy": self.file_change_entropy(
-                project_data.get('recent_commits', [])
-            )
+            "temporal_entropy": self._temporal_entropy_from_hours(hours),
+            "change_entropy": self._change_entropy_from_changes(changes)
         }
 
     def calculate_normalized_entropy(self, entropy_value: float, max_possible: float) -> float:
@@ -226,30 +365,154 @@ class EntropyCalculator:
             Dictionary with classification and metrics
         """
         if not contributor_data:
-            return {
-                "classification": "Unknown",
-                "confidence": 0.0,
-                "metrics": {},
-                "criteria_met": []
-            }
+            return self._unknown_classification()
 
-        # Calculate metrics
-        entropy, normalized_entropy = self.contributor_entropy(contributor_data)
-        contributions = [c.get('contributions', 0) for c in contributor_data]
-        total = sum(contributions)
+        # Calculate metrics (contribution counts are extracted and sorted once)
+        stats = ContributorStats.from_contributors(contributor_data)
+        entropy, normalized_entropy = self._entropy_from_stats(stats)
+        sorted_contributions = stats.sorted_contributions
+        total = stats.total
 
         if total == 0:
-            return {
-                "classification": "Unknown",
-                "confidence": 0.0,
-                "metrics": {},
-                "criteria_met": []
-            }
+            return self._unknown_classification()
+
+        # Top contributors come from the sorted counts, so input order doesn't matter
+        top1 = sorted_contributions[-1]
+        top2 = top1 + sorted_contributions[-2] if stats.count >= 2 else top1
+        top1_pct = top1 / total * 100
+        top2_pct = top2 / total * 100
+        gini = self._gini_from_sorted(sorted_contributions)
+
+        return self._classification_result(
+            entropy, normalized_entropy, gini, top1_pct, top2_pct, stats.count
+        )
+
+    def is_stadium_candidate(self, contributor_data: List[Dict[str, Any]]) -> bool:
+        """
+        Quick screen: does the project meet at least 2 of the 3 Stadium criteria?
+
+        Agrees with classify_project's stadium_score >= 2, but skips the full sort
+        that Gini needs whenever top contributor dominance and normalized entropy
+        already decide the outcome (both met or both missed).
+
+        Args:
+            contributor_data: List of contributor dictionaries
+
+        Returns:
+            True if classify_project would report "Stadium (Likely)" or stronger
+        """
+        if not contributor_data:
+            return False
+
+        contributions = np.fromiter(
+            (c.get('contributions', 0) for c in contributor_data),
+            dtype=np.float64,
+            count=len(contributor_data)
+        )
+        total = contributions.sum()
+        if total == 0:
+            return False
+
+        # Top contributor via O(n) partition instead of an O(n log n) sort
+        top1_pct = np.partition(contributions, -1)[-1] / total * 100
+        _, normalized_entropy = self._entropy_from_counts(contributions, total, len(contributions))
+
+        cheap_criteria = int(top1_pct > 40) + int(normalized_entropy < 0.6)
+        if cheap_criteria != 1:
+            return cheap_criteria == 2
+
+        # Tie-breaker: Gini decides, so sort now
+        contributions.sort()
+        return self._gini_from_sorted(contributions) > 0.8
+
+    def classify_projects(self, projects: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Classify many projects at once using the same criteria as classify_project.
 
-        top1_pct = contributions[0] / total * 100
-        top2_pct = sum(contributions[:2]) / total * 100 if len(contributions) >= 2 else top1_pct
-        gini = self.gini_coefficient(contributions)
+        All contributions are packed into one flat array with per-project segment
+        ids, so entropy, Gini and top-contributor shares are computed with a few
+        vectorized NumPy operations instead of one Python call per project.
 
+        Args:
+            projects: List of contributor lists, one per project
+
+        Returns:
+            List of classification dictionaries, in the same order as projects
+        """
+        n_projects = len(projects)
+        if n_projects == 0:
+            return []
+
+        lengths = np.fromiter((len(p) for p in projects), dtype=np.int64, count=n_projects)
+        values = np.fromiter(
+            (c.get('contributions', 0) for p in projects for c in p),
+            dtype=np.float64,
+            count=lengths.sum()
+        )
+        segments = np.repeat(np.arange(n_projects), lengths)
+        starts = np.cumsum(lengths) - lengths
+
+        # Sort ascending within each project (segments stay contiguous)
+        values = values[np.lexsort((values, segments))]
+        totals = np.bincount(segments, weights=values, minlength=n_projects)
+
+        # Entropy: H = log₂(T) - Σ c * log₂(c) / T per project
+        positive = values > 0
+        c_log_c = np.zeros_like(values)
+        c_log_c[positive] = values[positive] * np.log2(values[positive])
+        c_log_c_sums = np.bincount(segments, weights=c_log_c, minlength=n_projects)
+        has_total = totals > 0
+        safe_totals = np.where(has_total, totals, 1.0)
+        entropies = np.where(has_total, np.log2(safe_totals) - c_log_c_sums / safe_totals, 0.0)
+        entropies = np.maximum(entropies, 0.0)
+        max_entropies = np.log2(np.maximum(lengths, 1))
+        normalized = np.divide(entropies, max_entropies, out=np.zeros(n_projects), where=max_entropies > 0)
+
+        # Gini over positive values, ranked within each project (zeros sort first)
+        n_positive = np.bincount(segments[positive], minlength=n_projects)
+        ranks = np.arange(len(values)) - starts[segments] - (lengths - n_positive)[segments] + 1
+        weighted_sums = np.bincount(segments[positive], weights=(ranks * values)[positive], minlength=n_projects)
+        safe_n = np.maximum(n_positive, 1)
+        ginis = np.where(
+            n_positive > 0,
+            2 * weighted_sums / (safe_n * safe_totals) - (safe_n + 1) / safe_n,
+            0.0
+        )
+
+        # Top contributor shares from the last elements of each segment
+        # (gathered only where the segment is long enough; values may be empty)
+        ends = starts + lengths - 1
+        top1 = np.zeros(n_projects)
+        has_one = lengths > 0
+        top1[has_one] = values[ends[has_one]]
+        top2 = top1.copy()
+        has_two = lengths >= 2
+        top2[has_two] += values[ends[has_two] - 1]
+        top1_pcts = top1 / safe_totals * 100
+        top2_pcts = top2 / safe_totals * 100
+
+        return [
+            self._classification_result(
+                entropies[i], normalized[i], ginis[i], top1_pcts[i], top2_pcts[i], int(lengths[i])
+            ) if has_total[i] else self._unknown_classification()
+            for i in range(n_projects)
+        ]
+
+    @staticmethod
+    def _unknown_classification() -> Dict[str, Any]:
+        """Result for projects without usable contributor data."""
+        return {
+            "classification": "Unknown",
+            "confidence": 0.0,
+            "metrics": {},
+            "criteria_met": []
+        }
+
+    @staticmethod
+    def _classification_result(entropy: float, normalized_entropy: float, gini: float,
+                               top1_pct: float, top2_pct: float,
+                               total_contributors: int) -> Dict[str, Any]:
+        """Apply the refined Stadium criteria to precomputed metrics."""
         # Evaluate refined Stadium criteria
         criteria_met = []
 
@@ -292,7 +555,7 @@ class EntropyCalculator:
                 "gini_coefficient": gini,
                 "top_contributor_pct": top1_pct,
                 "top_2_contributors_pct": top2_pct,
-                "total_contributors": len(contributor_data)
+                "total_contributors": total_contributors
             }
         }
 
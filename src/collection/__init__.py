@@ -4,6 +4,7 @@ from .github_collector import GitHubCollector
 from .state_manager import StateManager
 from .token_pool import TokenPool
 from .rate_limiter import RateLimiter, RateLimitConfig
+from .response_cache import ResponseCache
 
 __all__ = [
     "GitHubCollector",
@@ -11,4 +12,5 @@ __all__ = [
     "TokenPool",
     "RateLimiter",
     "RateLimitConfig",
+    "ResponseCache",
 ]
@@ -24,12 +24,15 @@ Usage:
 """
 
 import argparse
+import os
 import signal
 import sys
 import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 from dotenv import load_dotenv
 
@@ -40,6 +43,25 @@ from .state_manager import StateManager
 from .token_pool import TokenPool
 from .rate_limiter import RateLimiter, RateLimitConfig
 from .github_collector import GitHubCollector
+from data.candidates import ALL_CANDIDATES, get_uncollected
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError:
+    _parse_iso_datetime = None
+
+# owner/repo -> owner_repo for data file names
+_SAFE_NAME = str.maketrans("/", "_")
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp, using ciso8601 when installed."""
+    if _parse_iso_datetime is not None:
+        return _parse_iso_datetime(value)
+    # fromisoformat only accepts a trailing "Z" from Python 3.11 on
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
 
 
 class CollectorDaemon:
@@ -53,6 +75,10 @@ class CollectorDaemon:
     - Progress tracking and reporting
     """
 
+    # Log queue state every N finished projects. Each flush appends one line per
+    # transition to the state log, so flushing per project is cheap.
+    STATE_FLUSH_EVERY = 1
+
     def __init__(
         self,
         state_path: Optional[Path] = None,
@@ -67,14 +93,16 @@ class CollectorDaemon:
             output_dir: Directory for output data
             since_days: Days of history to collect
         """
-        self.state_manager = StateManager(state_path)
+        self.state_manager = StateManager(
+            state_path, flush_every=self.STATE_FLUSH_EVERY
+        )
         self.output_dir = output_dir or Path("data/raw")
         self.since_days = since_days
 
         # Will be initialized lazily
         self._token_pool: Optional[TokenPool] = None
         self._rate_limiter: Optional[RateLimiter] = None
-        self._collector: Optional[GitHubCollector] = None
+        self._collectors: Dict[str, GitHubCollector] = {}  # One per token
 
         # Shutdown flag
         self._shutdown_requested = False
@@ -115,11 +143,8 @@ class CollectorDaemon:
 
     @property
     def collector(self) -> GitHubCollector:
-        """Lazy initialization of GitHub collector."""
-        if self._collector is None:
-            token = self.token_pool.get_any_token()
-            self._collector = GitHubCollector(token=token)
-        return self._collector
+        """GitHub collector for the next token in round-robin order."""
+        return self._collector_for(self.token_pool.next_token())
 
     def init_queue(self, category: str, include_collected: bool = False) -> None:
         """
@@ -129,9 +154,6 @@ class CollectorDaemon:
             category: Category name (stadium, federation, club, toy)
             include_collected: If True, include already collected projects
         """
-        # Import candidates
-        from data.candidates import ALL_CANDIDATES, get_uncollected
-
         if category not in ALL_CANDIDATES:
             print(f"❌ Unknown category: {category}")
             print(f"   Available: {', '.join(ALL_CANDIDATES.keys())}")
@@ -171,7 +193,7 @@ class CollectorDaemon:
         Returns:
             Summary of collection run
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         collected = 0
         failed = 0
 
@@ -186,64 +208,81 @@ class CollectorDaemon:
         print(f"   Wait on limit: {wait_on_limit}")
         print()
 
-        while not self._shutdown_requested:
-            # Check if we've hit our limit
-            if limit and collected >= limit:
-                print(f"\n✅ Reached collection limit ({limit})")
-                break
-
-            # Get next project
-            project = self.state_manager.get_next()
-            if not project:
-                print("\n✅ Queue empty - collection complete!")
-                break
-
-            # Check rate limit
-            if not self.rate_limiter.can_collect():
-                if wait_on_limit:
-                    print(f"\n⏳ Rate limit low. Current project: {project}")
-                    if not self.rate_limiter.wait_for_reset(interactive=interactive):
-                        print("   Wait interrupted. Progress saved.")
-                        break
-                else:
-                    print(f"\n⏸️  Rate limit low. Stopping collection.")
-                    print(f"   Use 'resume' command to continue later.")
-                    break
+        # (project, future) of the background write; the project stays pending until it lands
+        pending_write: Optional[Tuple[str, Future]] = None
 
-            # Collect project
+        def finish_write() -> None:
+            nonlocal collected, failed, pending_write
+            if pending_write is None:
+                return
+            if self._finish_write(pending_write):
+                collected += 1
+            else:
+                failed += 1
+            pending_write = None
+
+        def next_project(in_flight: List[str]) -> Optional[str]:
+            exclude = set(in_flight)
+            if pending_write is not None:
+                exclude.add(pending_write[0])
+            project = self.state_manager.peek_next(exclude=exclude)
+            if project and interactive:
+                print(f"📥 [{collected + len(exclude) + 1}] Collecting: {project}")
+            return project
+
+        def on_collected(project: str, token: str, future: Future) -> None:
+            nonlocal failed, pending_write
             try:
-                print(f"📥 [{collected + 1}] Collecting: {project}")
+                data, payload = future.result()
 
-                data = self.collector.collect_complete_dataset(
+                # Write in the background while workers keep collecting
+                finish_write()
+                pending_write = (
                     project,
-                    since_days=self.since_days
+                    writer.submit(GitHubCollector.write_data, payload, self._output_path(project))
                 )
 
-                # Save data
-                output_path = self.output_dir / f"{project.replace('/', '_')}_data.json"
-                self.collector.save_data(data, output_path)
-
-                # Mark completed
-                self.state_manager.mark_completed(project)
-                collected += 1
-
                 # Brief status
-                if "repository" in data:
+                if interactive and "repository" in data:
                     stars = data["repository"].get("stargazers_count", "?")
                     contributors = len(data.get("contributors", []))
-                    print(f"   ✅ Saved: ⭐ {stars} | 👥 {contributors} contributors")
+                    print(f"   ✅ Collected {project}: ⭐ {stars} | 👥 {contributors} contributors")
 
             except Exception as e:
                 error_msg = str(e)
-                print(f"   ❌ Failed: {error_msg}")
+                print(f"   ❌ Failed {project}: {error_msg}")
                 self.state_manager.mark_failed(project, error_msg)
                 failed += 1
 
-            # Update rate limiter with estimated usage
-            self.rate_limiter.report_usage(350)
+            self._report_rate_limit(token)
+
+        try:
+            # Single background writer: at most one project's JSON is in flight
+            with ThreadPoolExecutor(max_workers=1) as writer:
+                reason = self._run_on_tokens(
+                    next_project,
+                    self._collect_one,
+                    on_collected,
+                    room_for_more=lambda n: not limit or collected + (pending_write is not None) + n < limit,
+                    wait_on_limit=wait_on_limit,
+                    interactive=interactive
+                )
+
+                # Make sure the last write landed before reporting
+                finish_write()
+        finally:
+            # Batched queue transitions must reach disk even on errors
+            self.state_manager.flush()
+
+        if reason == "queue_empty":
+            print("\n✅ Queue empty - collection complete!")
+        elif reason == "limit":
+            print(f"\n✅ Reached collection limit ({limit})")
+        elif reason == "rate_limit":
+            print(f"   Use 'resume' command to continue later.")
 
         # Final summary
-        duration = time.time() - start_time
+        duration = time.monotonic() - start_time
         self.state_manager.update_statistics(
             api_calls=collected * 350,
             duration_sec=duration
@@ -256,6 +295,155 @@ class CollectorDaemon:
             "reason": "shutdown" if self._shutdown_requested else "complete"
         }
 
+    def _run_on_tokens(
+        self,
+        next_item: Callable[[List[Any]], Optional[Any]],
+        work: Callable[[Any, str], Any],
+        on_done: Callable[[Any, str, Future], None],
+        room_for_more: Callable[[int], bool],
+        wait_on_limit: bool = False,
+        interactive: bool = True
+    ) -> str:
+        """
+        Run work items in parallel with one worker thread per token.
+
+        Each token works on one item at a time, so throughput scales with the
+        pool while every token stays within its own rate limit. Tokens that run
+        low are parked; once all are low we wait for a reset or stop.
+
+        Args:
+            next_item: Returns the next item to start (given the items in flight), or None
+            work: Called in a worker thread as work(item, token)
+            on_done: Called on the calling thread as on_done(item, token, future)
+            room_for_more: Given the number of items in flight, whether another may start
+            wait_on_limit: If True, wait for rate limit reset and continue
+            interactive: Show progress while waiting
+
+        Returns:
+            Why the run stopped: "queue_empty", "limit", "rate_limit",
+            "interrupted" or "shutdown"
+        """
+        tokens = [t.token for t in self.token_pool.tokens]
+        # FIFO: a freed token goes to the back, so work rotates round-robin across
+        # tokens even when the limit keeps fewer items than tokens in flight
+        idle_tokens = deque(tokens)
+        low_tokens: List[str] = []
+        in_flight: Dict[Future, Tuple[Any, str]] = {}  # future -> (item, token)
+        queue_empty = False
+        skip_limit_check = False
+
+        with ThreadPoolExecutor(max_workers=len(tokens)) as workers:
+            while True:
+                # Hand every idle token an item
+                while idle_tokens and not queue_empty and not self._shutdown_requested:
+                    if not room_for_more(len(in_flight)):
+                        break
+
+                    token = idle_tokens.popleft()
+                    if not skip_limit_check and not self.rate_limiter.can_collect(token=token):
+                        low_tokens.append(token)
+                        continue
+
+                    item = next_item([i for i, _ in in_flight.values()])
+                    if item is None:
+                        queue_empty = True
+                        idle_tokens.appendleft(token)
+                        break
+
+                    in_flight[workers.submit(work, item, token)] = (item, token)
+                skip_limit_check = False
+
+                if not in_flight:
+                    if self._shutdown_requested:
+                        return "shutdown"
+                    if queue_empty:
+                        return "queue_empty"
+                    if not room_for_more(0):
+                        return "limit"
+
+                    # Every token is below the threshold
+                    if not wait_on_limit:
+                        print(f"\n⏸️  Rate limit low. Stopping.")
+                        return "rate_limit"
+                    print(f"\n⏳ Rate limit low on all {len(tokens)} token(s)")
+                    if not self.rate_limiter.wait_for_reset(interactive=interactive):
+                        print("   Wait interrupted. Progress saved.")
+                        return "interrupted"
+                    idle_tokens.extend(low_tokens)
+                    low_tokens.clear()
+                    skip_limit_check = True
+                    continue
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item, token = in_flight.pop(future)
+                    idle_tokens.append(token)
+                    on_done(item, token, future)
+
+    def _report_rate_limit(self, token: str) -> None:
+        """Pass the rate limit from a token's last API response to the rate limiter."""
+        try:
+            remaining, reset_at = self._collector_for(token).get_last_rate_limit()
+        except Exception:
+            # No usable headers: fall back to the per-project estimate
+            self.rate_limiter.report_usage(self.rate_limiter.config.calls_per_project_estimate, token)
+            return
+        self.rate_limiter.report_actual(token, remaining, reset_at)
+
+    def _collector_for(self, token: str) -> GitHubCollector:
+        """Get (or create) the collector bound to a token."""
+        collector = self._collectors.get(token)
+        if collector is None:
+            collector = self._collectors[token] = GitHubCollector(token=token)
+        return collector
+
+    def _collect_one(self, project: str, token: str) -> Tuple[Dict[str, Any], bytes]:
+        """
+        Collect and serialize one project (runs in a worker thread).
+
+        Args:
+            project: Repository in "owner/repo" format
+            token: Token reserved for this worker
+
+        Returns:
+            Tuple of (data, serialized JSON payload)
+        """
+        collector = self._collector_for(token)
+        data = collector.collect_complete_dataset(project, since_days=self.since_days)
+        # Serialize in the worker so errors surface before the project is marked completed
+        return data, collector.serialize_data(data)
+
+    def _output_path(self, project: str) -> Path:
+        """Data file path for an owner/repo project."""
+        return self.output_dir / (project.translate(_SAFE_NAME) + "_data.json")
+
+    def _finish_write(self, pending_write: Optional[Tuple[str, Future]]) -> bool:
+        """
+        Wait for a background data write, then mark its project completed or failed.
+
+        The project is only marked completed once its data is on disk, so a
+        crash mid-write leaves it pending to be collected again.
+
+        Args:
+            pending_write: (project, future) from the writer, or None
+
+        Returns:
+            True if there was nothing to wait for or the write succeeded
+        """
+        if pending_write is None:
+            return True
+
+        project, future = pending_write
+        try:
+            future.result()
+            self.state_manager.mark_completed(project)
+            return True
+        except Exception as e:
+            error_msg = f"Failed to write data: {e}"
+            print(f"   ❌ {project}: {error_msg}")
+            self.state_manager.mark_failed(project, error_msg)
+            return False
+
     def resume(self, **kwargs) -> dict:
         """Resume collection from where it left off."""
         return self.collect(**kwargs)
@@ -289,115 +477,121 @@ class CollectorDaemon:
         Returns:
             Summary of update run
         """
-        import json
-        from datetime import datetime, timezone
-
-        start_time = time.time()
+        start_time = time.monotonic()
         updated = 0
         failed = 0
         skipped = 0
 
         # Find projects to update
-        data_files = list(self.output_dir.glob("*_data.json"))
-
-        if not data_files:
-            print("ℹ️  No collected data found to update")
-            return {"updated": 0, "failed": 0, "skipped": 0}
-
-        # Filter by category if specified
         if category:
-            from data.candidates import ALL_CANDIDATES
             if category not in ALL_CANDIDATES:
                 print(f"❌ Unknown category: {category}")
                 return {"updated": 0, "failed": 0, "skipped": 0, "error": "unknown_category"}
 
-            category_projects = set(p.replace("/", "_") for p in ALL_CANDIDATES[category])
-            data_files = [f for f in data_files if f.stem.replace("_data", "") in category_projects]
+            # Build the category's paths directly instead of listing the whole directory
+            data_files = [
+                path for path in map(self._output_path, ALL_CANDIDATES[category])
+                if path.exists()
+            ]
+        else:
+            # scandir reuses the file type from readdir rather than stat-ing each entry
+            data_files = []
+            if self.output_dir.is_dir():
+                with os.scandir(self.output_dir) as entries:
+                    data_files = [
+                        Path(entry.path) for entry in entries
+                        if entry.name.endswith("_data.json") and entry.is_file()
+                    ]
+
+        if not data_files:
+            print("ℹ️  No collected data found to update")
+            return {"updated": 0, "failed": 0, "skipped": 0}
 
         print(f"\n🔄 Updating {len(data_files)} projects...")
         if category:
             print(f"   Category: {category}")
         print()
 
-        for data_file in data_files:
-            if self._shutdown_requested:
-                break
-
-            if limit and updated >= limit:
-                print(f"\n✅ Reached update limit ({limit})")
-                break
-
-            # Check rate limit
-            if not self.rate_limiter.can_collect():
-                if wait_on_limit:
-                    if not self.rate_limiter.wait_for_reset(interactive=True):
-                        break
-                else:
-                    print(f"\n⏸️  Rate limit low. Stopping update.")
+        # Pipeline: readers parse a few files ahead of the token workers, and a
+        # single writer saves merged files so workers go straight to their next project
+        remaining_files = iter(data_files)
+        prefetched: Deque[Tuple[Path, Future]] = deque()
+        prefetch_depth = len(self.token_pool.tokens) + 1
+        pending_write: Optional[Tuple[Path, Future, bool]] = None
+
+        def next_file(in_flight: List[Any]) -> Optional[Tuple[Path, Future]]:
+            while len(prefetched) < prefetch_depth:
+                data_file = next(remaining_files, None)
+                if data_file is None:
                     break
+                prefetched.append((data_file, readers.submit(GitHubCollector.load_data, data_file)))
+            return prefetched.popleft() if prefetched else None
 
-            # Load existing data
+        def update_one(item: Tuple[Path, Future], token: str) -> Optional[Tuple[int, Optional[bytes], bool]]:
+            return self._update_one(*item, token, since_days)
+
+        def finish_write() -> None:
+            nonlocal updated, failed
+            if pending_write is None:
+                return
+            data_file, write, counted = pending_write
             try:
-                with open(data_file, 'r') as f:
-                    existing_data = json.load(f)
+                write.result()
             except Exception as e:
-                print(f"   ⚠️  Could not read {data_file.name}: {e}")
-                skipped += 1
-                continue
-
-            # Get project name and last collection date
-            project = existing_data.get("metadata", {}).get("repo")
-            if not project:
-                # Try to extract from filename
-                project = data_file.stem.replace("_data", "").replace("_", "/", 1)
-
-            last_collected = existing_data.get("metadata", {}).get("collected_at")
-
-            # Calculate days since last collection
-            if since_days:
-                days_to_collect = since_days
-            elif last_collected:
-                try:
-                    last_date = datetime.fromisoformat(last_collected.replace("Z", "+00:00"))
-                    days_since = (datetime.now(timezone.utc) - last_date).days
-                    days_to_collect = max(1, days_since)  # At least 1 day
-                except:
-                    days_to_collect = 30  # Default fallback
-            else:
-                days_to_collect = 30
-
-            if days_to_collect < 1:
-                print(f"   ⏭️  {project}: Already up to date")
-                skipped += 1
-                continue
-
-            print(f"📥 [{updated + 1}] Updating: {project} (last {days_to_collect} days)")
-
+                print(f"   ❌ Failed to write {data_file.name}: {e}")
+                if counted:
+                    updated -= 1
+                    failed += 1
+
+        def on_updated(item: Tuple[Path, Future], token: str, future: Future) -> None:
+            nonlocal updated, failed, skipped, pending_write
+            data_file = item[0]
             try:
-                # Collect new data
-                new_data = self.collector.collect_complete_dataset(
-                    project,
-                    since_days=days_to_collect
-                )
-
-                # Merge with existing data
-                merged_data = self._merge_delta(existing_data, new_data)
-
-                # Save merged data
-                self.collector.save_data(merged_data, data_file)
-
-                updated += 1
-                new_commits = len(new_data.get("recent_commits", []))
-                print(f"   ✅ Updated: +{new_commits} new commits")
-
+                result = future.result()
             except Exception as e:
                 error_msg = str(e)
-                print(f"   ❌ Failed: {error_msg}")
+                print(f"   ❌ Failed {data_file.name}: {error_msg}")
                 failed += 1
+            else:
+                if result is None:
+                    skipped += 1
+                    return
+                new_commits, payload, has_changes = result
+                if payload is not None:
+                    finish_write()
+                    pending_write = (
+                        data_file,
+                        writer.submit(GitHubCollector.write_data, payload, data_file),
+                        has_changes
+                    )
+                if has_changes:
+                    updated += 1
+                    print(f"   ✅ Updated {data_file.name}: +{new_commits} new commits")
+                else:
+                    print(f"   ⏭️  {data_file.name}: No changes")
+                    skipped += 1
+
+            self._report_rate_limit(token)
+
+        with ThreadPoolExecutor(max_workers=2) as readers, ThreadPoolExecutor(max_workers=1) as writer:
+            reason = self._run_on_tokens(
+                next_file,
+                update_one,
+                on_updated,
+                room_for_more=lambda n: not limit or updated + n < limit,
+                wait_on_limit=wait_on_limit,
+                interactive=True
+            )
+            finish_write()
 
-            self.rate_limiter.report_usage(350)
+            # Parses started ahead of a stop are simply discarded
+            for _, load in prefetched:
+                load.cancel()
 
-        duration = time.time() - start_time
+        if reason == "limit":
+            print(f"\n✅ Reached update limit ({limit})")
+
+        duration = time.monotonic() - start_time
 
         print(f"\n📊 Update Summary:")
         print(f"   Updated: {updated}")
@@ -412,19 +606,166 @@ class CollectorDaemon:
             "duration_seconds": duration
         }
 
-    def _merge_delta(self, existing: dict, new_data: dict) -> dict:
+    def _update_one(
+        self,
+        data_file: Path,
+        existing: Future,
+        token: str,
+        since_days: Optional[int]
+    ) -> Optional[Tuple[int, Optional[bytes], bool]]:
+        """
+        Collect and merge the delta for one data file (runs in a worker thread).
+
+        Args:
+            data_file: Previously collected data file
+            existing: Future parsing data_file (started ahead by update())
+            token: Token reserved for this worker
+            since_days: Override days to look back (default: since last collection)
+
+        Returns:
+            Tuple of (new commit count, serialized data to write, whether the
+            delta had changes), or None if the project was skipped. An empty
+            delta only returns data when the repository ETag needs saving.
+        """
+        # Load existing data
+        try:
+            existing_data = existing.result()
+        except Exception as e:
+            print(f"   ⚠️  Could not read {data_file.name}: {e}")
+            return None
+
+        # Get project name and last collection date
+        project = existing_data.get("metadata", {}).get("repo")
+        if not project:
+            # Try to extract from filename
+            project = data_file.stem.replace("_data", "").replace("_", "/", 1)
+
+        last_collected = existing_data.get("metadata", {}).get("collected_at")
+
+        # Calculate days since last collection
+        if since_days:
+            days_to_collect = since_days
+        elif last_collected:
+            try:
+                last_date = _parse_timestamp(last_collected)
+                days_since = (datetime.now(timezone.utc) - last_date).days
+                days_to_collect = max(1, days_since)  # At least 1 day
+            except (ValueError, TypeError):
+                days_to_collect = 30  # Default fallback
+        else:
+            days_to_collect = 30
+
+        if days_to_collect < 1:
+            print(f"   ⏭️  {project}: Already up to date")
+            return None
+
+        collector = self._collector_for(token)
+        etags = existing_data.get("metadata", {}).get("etags", {})
+
+        # A 304 on the repository means no pushes, stars or issue/PR changes since
+        # the last check, and costs no rate limit. An explicit since_days may
+        # reach further back than before, so it always collects.
+        changed, repository_etag = collector.check_repository_changed(
+            project, etags.get("repository")
+        )
+        if not changed and not since_days:
+            print(f"   ⏭️  {project}: Unchanged since last update")
+            return None
+
+        print(f"📥 Updating: {project} (last {days_to_collect} days)")
+
+        # Collect new data
+        new_data = collector.collect_complete_dataset(
+            project,
+            since_days=days_to_collect
+        )
+
+        # Dedupe commits once; both the empty check and the merge use the result
+        unseen_commits = self._unseen_commits(existing_data, new_data)
+        new_commits = len(unseen_commits)
+        if self._is_empty_delta(existing_data, new_data, unseen_commits):
+            if not repository_etag or repository_etag == etags.get("repository"):
+                # Nothing worth rewriting the file for
+                return new_commits, None, False
+
+            # Still save the new ETag, so the next update can stop at a 304
+            existing_data.setdefault("metadata", {})["etags"] = {**etags, "repository": repository_etag}
+            return new_commits, collector.serialize_data(existing_data), False
+
+        # Merge with existing data; update() writes it in the background
+        merged_data = self._merge_delta(existing_data, new_data, unseen_commits)
+        if repository_etag:
+            merged_data["metadata"]["etags"] = {**etags, "repository": repository_etag}
+
+        return new_commits, collector.serialize_data(merged_data), True
+
+    @staticmethod
+    def _unseen_commits(existing: dict, new_data: dict) -> List[dict]:
+        """
+        Get delta commits whose SHA is not in the existing data, in delta order.
+
+        A single pass that also drops duplicates within the delta itself.
+        """
+        delta = new_data.get("recent_commits")
+        if not delta:
+            return []
+
+        seen = {c["sha"] for c in existing.get("recent_commits", [])}
+        unseen = []
+        for commit in delta:
+            sha = commit["sha"]
+            if sha not in seen:
+                seen.add(sha)
+                unseen.append(commit)
+        return unseen
+
+    @staticmethod
+    def _is_empty_delta(existing: dict, new_data: dict, unseen_commits: List[dict]) -> bool:
+        """
+        Check whether a delta brings nothing new.
+
+        A delta is empty when it has no unseen commits, no contributor changes and
+        the same repository metrics (ignoring their collection timestamp). PR and
+        issue stats are summaries of the delta window, not new records, so they
+        don't count.
+
+        Args:
+            existing: Previously collected data
+            new_data: Newly collected delta data
+            unseen_commits: Result of _unseen_commits(existing, new_data)
+
+        Returns:
+            True if merging would only touch timestamps
+        """
+        if unseen_commits:
+            return False
+
+        if "contributors" in new_data:
+            counts = {c["login"]: c.get("contributions") for c in existing.get("contributors", [])}
+            if any(counts.get(c["login"]) != c["contributions"] for c in new_data["contributors"]):
+                return False
+
+        if "repository" in new_data:
+            def metrics(repository: dict) -> dict:
+                return {k: v for k, v in repository.items() if k != "collected_at"}
+            if metrics(new_data["repository"]) != metrics(existing.get("repository", {})):
+                return False
+
+        return True
+
+    def _merge_delta(self, existing: dict, new_data: dict,
+                     unseen_commits: Optional[List[dict]] = None) -> dict:
         """
         Merge new delta data with existing collected data.
 
         Args:
             existing: Previously collected data
             new_data: Newly collected delta data
+            unseen_commits: Precomputed _unseen_commits(existing, new_data) (optional)
 
         Returns:
             Merged dataset
         """
-        from datetime import datetime, timezone
-
         merged = existing.copy()
 
         # Update metadata
@@ -435,11 +776,13 @@ class CollectorDaemon:
         if "repository" in new_data:
             merged["repository"] = new_data["repository"]
 
-        # Merge commits (deduplicate by SHA)
-        if "recent_commits" in new_data:
-            existing_shas = {c["sha"] for c in merged.get("recent_commits", [])}
-            new_commits = [c for c in new_data["recent_commits"] if c["sha"] not in existing_shas]
-            merged["recent_commits"] = new_commits + merged.get("recent_commits", [])
+        # Merge commits (deduplicate by SHA). An empty delta skips indexing the
+        # existing history altogether.
+        if unseen_commits is None:
+            unseen_commits = self._unseen_commits(merged, new_data)
+        if unseen_commits:
+            # Newest first on disk: prepend in place rather than building a concatenated copy
+            merged.setdefault("recent_commits", [])[:0] = unseen_commits
 
         # Update PR stats (use latest)
         if "pull_requests" in new_data:
@@ -450,22 +793,36 @@ class CollectorDaemon:
             merged["issues"] = new_data["issues"]
 
         # Update contributors (merge and deduplicate)
-        if "contributors" in new_data:
-            existing_logins = {c["login"] for c in merged.get("contributors", [])}
-            # Update existing contributor counts
-            for new_c in new_data["contributors"]:
-                if new_c["login"] in existing_logins:
-                    # Find and update
-                    for i, ec in enumerate(merged["contributors"]):
-                        if ec["login"] == new_c["login"]:
-                            merged["contributors"][i]["contributions"] = new_c["contributions"]
-                            break
-                else:
-                    merged["contributors"].append(new_c)
+        new_contributors = new_data.get("contributors")
+        if new_contributors:
+            contributors = merged.setdefault("contributors", [])
+
+            # Quiescent repos return the same leading contributors with the same
+            # counts; a positional comparison skips building the login index.
+            unchanged = len(new_contributors) <= len(contributors) and all(
+                new_c["login"] == old_c.get("login")
+                and new_c["contributions"] == old_c.get("contributions")
+                for new_c, old_c in zip(new_contributors, contributors)
+            )
 
-        # Re-sort contributors by contributions
-        if "contributors" in merged:
-            merged["contributors"].sort(key=lambda x: x.get("contributions", 0), reverse=True)
+            if not unchanged:
+                by_login = {c["login"]: c for c in contributors}
+                reorder = False
+                for new_c in new_contributors:
+                    existing_c = by_login.get(new_c["login"])
+                    if existing_c is not None:
+                        # Update existing contributor count
+                        if existing_c.get("contributions") != new_c["contributions"]:
+                            existing_c["contributions"] = new_c["contributions"]
+                            reorder = True
+                    else:
+                        contributors.append(new_c)
+                        by_login[new_c["login"]] = new_c
+                        reorder = True
+
+                # Re-sort contributors by contributions, only if counts or members changed
+                if reorder:
+                    contributors.sort(key=lambda x: x.get("contributions", 0), reverse=True)
 
         return merged
 
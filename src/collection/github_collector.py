@@ -3,50 +3,329 @@ GitHub Data Collector
 Collects repository metrics, commits, PRs, issues, and contributor data from GitHub API.
 """
 
+import base64
 import os
+import posixpath
 import time
 import json
+import random
 import re
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Any
+from statistics import fmean
+from typing import Callable, Dict, Iterator, List, Optional, Any, Tuple
 from pathlib import Path
 
 import requests
 import warnings
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 from github import Github, RateLimitExceededException, Auth
 from tqdm import tqdm
 from dotenv import load_dotenv
 
+try:
+    from .response_cache import ResponseCache
+    from .token_pool import TokenPool
+except ImportError:
+    # Run as a script: python src/collection/github_collector.py
+    from response_cache import ResponseCache
+    from token_pool import TokenPool
+
 # Load environment variables
 load_dotenv()
 
 # Suppress OpenSSL warning
 warnings.filterwarnings("ignore", message="urllib3 v2 only supports OpenSSL")
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import httpx
+    import h2  # noqa: F401 - required by httpx for http2=True
+except ImportError:
+    httpx = None
+
+# Keep-alive connections per client (api.github.com is the only host)
+HTTP_POOL_SIZE = 16
+
+# Sections of a dataset fetched concurrently per project. Each section is a
+# chain of blocking HTTPS requests, so threads overlap their latency.
+SECTION_WORKERS = 4
+
+# Repositories collected at once by the command-line entry point
+REPO_WORKERS = 4
+
+# Direct API requests in flight per token. GitHub's secondary rate limits
+# trip well below its documented ceiling of ~100 concurrent requests.
+MAX_CONCURRENT_REQUESTS = 8
+MAX_RETRIES = 5
+MAX_RETRY_WAIT = 120  # Longer waits are left to the daemon's rate limiter
+RETRY_STATUSES = (403, 429, 500, 502, 503, 504)
+
+# Endpoints used directly (outside PyGithub), filled in with str.format
+API_URL = "https://api.github.com"
+GRAPHQL_URL = f"{API_URL}/graphql"
+REPO_URL = API_URL + "/repos/{repo}"
+CONTRIBUTORS_URL = REPO_URL + "/contributors"
+COLLABORATORS_URL = REPO_URL + "/collaborators"
+CONTENTS_URL = REPO_URL + "/contents/{path}"
+
+# Everything collect_repository_metrics needs, in one round trip. The REST
+# issues listing counts open pull requests as issues, hence both totals.
+# GraphQL has no has_pages flag; Pages builds deploy to "github-pages".
+REPOSITORY_METRICS_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    name
+    nameWithOwner
+    description
+    createdAt
+    updatedAt
+    pushedAt
+    diskUsage
+    stargazerCount
+    forkCount
+    issues(states: OPEN) { totalCount }
+    pullRequests(states: OPEN) { totalCount }
+    primaryLanguage { name }
+    repositoryTopics(first: 100) { nodes { topic { name } } }
+    hasWikiEnabled
+    pagesDeployments: deployments(environments: ["github-pages"]) { totalCount }
+    hasDiscussionsEnabled
+    isArchived
+    isDisabled
+    defaultBranchRef { name }
+    licenseInfo { name }
+  }
+}
+"""
+
+# REST listings: largest page size GitHub allows, and the page number in Link
+REST_PAGE_SIZE = 100
+LAST_PAGE_RE = re.compile(r'[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+# Default-branch history with per-commit stats, which the REST commit listing
+# leaves out (PyGithub fetches them with one extra request per commit).
+COMMIT_PAGE_SIZE = 100
+COMMIT_HISTORY_QUERY = """
+query($owner: String!, $name: String!, $since: GitTimestamp!, $first: Int!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    defaultBranchRef {
+      target {
+        ... on Commit {
+          history(since: $since, first: $first, after: $cursor) {
+            totalCount
+            pageInfo { hasNextPage endCursor }
+            nodes {
+              oid
+              message
+              additions
+              deletions
+              author { name date user { login } }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Largest "first:" GitHub accepts on a connection
+GRAPHQL_PAGE_SIZE = 100
+
+# Pull requests and issues with every field the collectors read, 100 per page.
+# REST fetched these one page of 30 at a time, plus lazy per-item requests.
+PULL_REQUESTS_QUERY = """
+query($owner: String!, $name: String!, $states: [PullRequestState!], $orderField: IssueOrderField!,
+      $first: Int!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(states: $states, orderBy: {field: $orderField, direction: DESC},
+                 first: $first, after: $cursor) {
+      totalCount
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number
+        title
+        state
+        createdAt
+        updatedAt
+        closedAt
+        mergedAt
+        merged
+        mergeable
+        author { login }
+        comments { totalCount }
+        reviewThreads(first: 100) { nodes { comments { totalCount } } }
+        commits { totalCount }
+        additions
+        deletions
+        changedFiles
+      }
+    }
+  }
+}
+"""
+
+ISSUES_QUERY = """
+query($owner: String!, $name: String!, $states: [IssueState!], $since: DateTime,
+      $first: Int!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    issues(states: $states, filterBy: {since: $since}, orderBy: {field: CREATED_AT, direction: DESC},
+           first: $first, after: $cursor) {
+      totalCount
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number
+        title
+        state
+        createdAt
+        closedAt
+        author { login }
+        comments { totalCount }
+        labels(first: 50) { nodes { name } }
+      }
+    }
+  }
+}
+"""
+
+# GraphQL only knows whether a PR conflicts; map onto REST mergeable_state
+MERGEABLE_STATES = {"MERGEABLE": "clean", "CONFLICTING": "dirty", "UNKNOWN": "unknown"}
+
+# GitHub usernames in maintainer files, as @username or a github.com/username
+# URL (which also covers markdown links like [Name](https://github.com/username))
+GITHUB_USERNAME = r'[a-zA-Z0-9](?:[a-zA-Z0-9]|-(?=[a-zA-Z0-9])){0,38}'
+MAINTAINER_RE = re.compile(
+    rf'@(?P<at>{GITHUB_USERNAME})|github\.com/(?P<url>{GITHUB_USERNAME})(?=[/)\s]|$)'
+)
+
+# Issue label keywords and the statistic each one counts towards
+LABEL_CATEGORIES = {"bug": "bug", "enhancement": "enhancement", "feature": "enhancement", "question": "question"}
+LABEL_CATEGORY_RE = re.compile("|".join(LABEL_CATEGORIES))
+
+
+def _json_serializer(obj):
+    """Custom JSON serializer for non-serializable objects."""
+    if hasattr(obj, '__dict__'):
+        return str(obj)
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _parse_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, with orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _parse_timestamp(timestamp: str) -> datetime:
+    """Parse a GraphQL timestamp into an aware UTC datetime."""
+    return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).astimezone(timezone.utc)
+
+
+def _isoformat(timestamp: str) -> str:
+    """Normalize a GraphQL timestamp to the UTC isoformat() used in saved data."""
+    return _parse_timestamp(timestamp).isoformat()
+
+
+class _Http2Session:
+    """
+    HTTP/2 client with the slice of the requests.Session API the collector uses.
+
+    Concurrent requests are multiplexed as streams over one TLS connection
+    instead of each holding a pooled HTTP/1.1 connection. Responses are
+    returned as requests.Response objects so callers don't change.
+    """
+
+    def __init__(self, pool_size: int = HTTP_POOL_SIZE):
+        self.headers: Dict[str, str] = {}
+        self._client = httpx.Client(
+            http2=True,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        )
+
+    def request(self, method: str, url: str, params: Optional[Dict[str, Any]] = None,
+                headers: Optional[Dict[str, str]] = None, json: Any = None,
+                timeout: Optional[float] = None) -> requests.Response:
+        try:
+            raw = self._client.request(
+                method, url,
+                params=params,
+                headers={**self.headers, **(headers or {})},
+                json=json,
+                timeout=timeout
+            )
+        except httpx.HTTPError as e:
+            raise requests.ConnectionError(str(e)) from e
+
+        response = requests.Response()
+        response.status_code = raw.status_code
+        response.reason = raw.reason_phrase
+        response.headers = CaseInsensitiveDict(raw.headers)
+        response.url = str(raw.url)
+        response.encoding = raw.encoding
+        response._content = raw.content
+        return response
+
 
 class GitHubCollector:
     """Collects data from GitHub repositories."""
 
-    def __init__(self, token: Optional[str] = None):
+    def __init__(self, token: Optional[str] = None,
+                 cache_dir: Optional[Path] = ResponseCache.DEFAULT_CACHE_DIR):
         """
         Initialize GitHub collector.
 
         Args:
             token: GitHub personal access token. If None, reads from GITHUB_TOKEN env var.
+            cache_dir: Directory for cached GET responses (revalidated with ETags).
+                None disables the cache.
         """
         self.token = token or os.getenv("GITHUB_TOKEN")
         if not self.token:
             raise ValueError("GitHub token required. Set GITHUB_TOKEN env var or pass token parameter.")
 
-        # Use newer PyGithub Auth API
+        # Use newer PyGithub Auth API. Both clients keep their HTTPS connections
+        # alive in a pool, so TLS handshakes are paid once rather than per call.
         auth = Auth.Token(self.token)
-        self.github = Github(auth=auth)
+        self.github = Github(auth=auth, pool_size=HTTP_POOL_SIZE)
 
-        self.session = requests.Session()
+        # Direct API calls multiplex over HTTP/2 when httpx[http2] is installed
+        if httpx is not None:
+            self.session = _Http2Session(HTTP_POOL_SIZE)
+        else:
+            self.session = requests.Session()
+            self.session.mount("https://", HTTPAdapter(pool_maxsize=HTTP_POOL_SIZE))
         self.session.headers.update({
             "Authorization": f"token {self.token}",
             "Accept": "application/vnd.github.v3+json"
         })
+        self._request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+        self._cache = ResponseCache(cache_dir) if cache_dir else None
+        self._repos: Dict[str, Any] = {}
+        self._core_rate_limit: Optional[Tuple[int, int]] = None  # (remaining, reset epoch)
+
+    def _repo(self, repo_full_name: str):
+        """
+        Get a lazy PyGithub Repository, shared by all methods for this repo.
+
+        Lazy objects skip the GET /repos/{owner}/{repo} each get_repo() call
+        would make; the collection methods only need it to build URLs.
+        """
+        repo = self._repos.get(repo_full_name)
+        if repo is None:
+            repo = self._repos[repo_full_name] = self.github.get_repo(repo_full_name, lazy=True)
+        return repo
 
     def get_rate_limit(self) -> Dict[str, Any]:
         """Get current GitHub API rate limit status."""
@@ -75,6 +354,292 @@ class GitHubCollector:
             }
         }
 
+    def get_last_rate_limit(self) -> Tuple[int, datetime]:
+        """
+        Get the core rate limit as reported by the most recent API response.
+
+        PyGithub records the X-RateLimit-Remaining/X-RateLimit-Reset headers of
+        every response, and _request() does the same for direct REST calls, so
+        once the collector has made a request this costs no extra API call.
+
+        Returns:
+            Tuple of (remaining, reset_at)
+        """
+        remaining, _ = self.github.rate_limiting
+        reset = self.github.rate_limiting_resettime
+
+        # Direct session requests draw on the same core limit. Within one window
+        # the lower count is the more recent; a later reset is a newer window.
+        if self._core_rate_limit is not None:
+            session_remaining, session_reset = self._core_rate_limit
+            if session_reset > reset or (session_reset == reset and session_remaining < remaining):
+                remaining, reset = session_remaining, session_reset
+
+        return remaining, datetime.fromtimestamp(reset, tz=timezone.utc)
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request on the pooled session, backing off on rate limits.
+
+        GETs are revalidated against the response cache when one is configured.
+        At most MAX_CONCURRENT_REQUESTS run at once. A 403/429 that GitHub marks
+        as rate limited (Retry-After, or an exhausted limit that resets soon) is
+        retried after the advertised delay, or with exponential backoff; so are
+        transient 5xx errors.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Passed to requests.Session.request
+
+        Returns:
+            The final response (possibly still an error once retries run out)
+        """
+        # Revalidate cached GETs, unless the caller manages its own ETag
+        cached = None
+        if self._cache is not None and method == "GET" and "headers" not in kwargs:
+            if kwargs.get("params"):
+                # Key the cache on the full URL, query string included
+                url = requests.Request(method, url, params=kwargs.pop("params")).prepare().url
+            cached = self._cache.get(url)
+            if cached:
+                kwargs["headers"] = {"If-None-Match": cached["etag"]}
+
+        for attempt in range(MAX_RETRIES + 1):
+            with self._request_slots:
+                response = self.session.request(method, url, **kwargs)
+            self._record_rate_limit(response)
+
+            if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                return self._apply_cache(url, response, cached) if method == "GET" else response
+
+            delay = self._retry_delay(response, attempt)
+            if delay is None:
+                return response
+            time.sleep(delay)
+
+        return response
+
+    def _record_rate_limit(self, response: requests.Response) -> None:
+        """Remember the core rate limit headers of a direct REST response (GraphQL has its own limit)."""
+        headers = response.headers
+        if headers.get("X-RateLimit-Resource", "core") != "core":
+            return
+        try:
+            self._core_rate_limit = (int(headers["X-RateLimit-Remaining"]), int(headers["X-RateLimit-Reset"]))
+        except (KeyError, ValueError):
+            pass
+
+    def _apply_cache(self, url: str, response: requests.Response,
+                     cached: Optional[Dict[str, Any]]) -> requests.Response:
+        """
+        Serve a 304 from the cache, or store a fresh 200 that carries an ETag.
+
+        Args:
+            url: Request URL
+            response: Response to the (conditional) GET
+            cached: Cache entry the request was revalidating, if any
+
+        Returns:
+            The response, turned into a 200 with the cached body on a cache hit
+        """
+        if self._cache is None:
+            return response
+
+        if response.status_code == 304 and cached:
+            response.status_code = 200
+            response._content = cached["body"].encode()
+            response.encoding = "utf-8"
+        elif response.status_code == 200 and response.headers.get("ETag"):
+            self._cache.put(url, response.headers["ETag"], response.text)
+        return response
+
+    @staticmethod
+    def _retry_delay(response: requests.Response, attempt: int) -> Optional[float]:
+        """
+        Seconds to wait before retrying an error response, or None if it should not be retried.
+
+        Args:
+            response: A response with one of RETRY_STATUSES
+            attempt: Zero-based attempt number, for exponential backoff
+
+        Returns:
+            Delay in seconds (with jitter), or None
+        """
+        jitter = random.uniform(0, 1)
+        if response.status_code >= 500:
+            return min(2 ** attempt, MAX_RETRY_WAIT) + jitter
+
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                delay = 2 ** attempt
+            return delay + jitter if delay <= MAX_RETRY_WAIT else None
+
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            reset = response.headers.get("X-RateLimit-Reset")
+            delay = float(reset) - time.time() if reset else MAX_RETRY_WAIT + 1
+            return max(0.0, delay) + jitter if delay <= MAX_RETRY_WAIT else None
+
+        if response.status_code == 429 or "secondary rate limit" in response.text.lower():
+            return min(2 ** attempt, MAX_RETRY_WAIT) + jitter
+
+        # A plain 403 (e.g. missing permissions) won't improve with retries
+        return None
+
+    def _get_pages(self, url: str, params: Optional[Dict[str, Any]] = None,
+                   max_items: Optional[int] = None) -> List[Any]:
+        """
+        Fetch a paginated REST listing, requesting pages after the first concurrently.
+
+        The first response's Link header names the last page, so the remaining
+        page numbers are known up front; _request() bounds how many run at once.
+
+        Args:
+            url: Listing URL
+            params: Query parameters (per_page and page are set here)
+            max_items: Stop after this many items (fetches only the pages needed)
+
+        Returns:
+            Items from all fetched pages, in order
+
+        Raises:
+            requests.HTTPError: If any page request fails
+        """
+        params = dict(params or {}, per_page=REST_PAGE_SIZE)
+
+        def fetch(page: int) -> Tuple[requests.Response, List[Any]]:
+            response = self._request("GET", url, params=dict(params, page=page), timeout=30)
+            response.raise_for_status()
+            # 204 No Content for empty listings (e.g. contributors of an empty repo)
+            return response, _parse_json(response) if response.content else []
+
+        first, items = fetch(1)
+        match = LAST_PAGE_RE.search(first.headers.get("Link", ""))
+        last_page = int(match.group(1)) if match else 1
+        if max_items is not None:
+            last_page = min(last_page, -(-max_items // REST_PAGE_SIZE))
+
+        if last_page > 1:
+            with ThreadPoolExecutor(max_workers=min(last_page - 1, MAX_CONCURRENT_REQUESTS)) as executor:
+                for _, page_items in executor.map(fetch, range(2, last_page + 1)):
+                    items.extend(page_items)
+
+        return items[:max_items] if max_items is not None else items
+
+    def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run a GraphQL query against the GitHub API.
+
+        Args:
+            query: GraphQL query document
+            variables: Query variables
+
+        Returns:
+            The "data" object of the response
+
+        Raises:
+            requests.HTTPError: On a non-2xx response
+            RuntimeError: If GitHub reports query errors
+        """
+        response = self._request(
+            "POST",
+            GRAPHQL_URL,
+            json={"query": query, "variables": variables},
+            timeout=30
+        )
+        response.raise_for_status()
+        payload = _parse_json(response)
+        if payload.get("errors"):
+            raise RuntimeError("; ".join(e.get("message", str(e)) for e in payload["errors"]))
+        return payload["data"]
+
+    def _iter_connection(self, query: str, variables: Dict[str, Any], connection: str,
+                         limit: int, desc: Optional[str] = None,
+                         stop: Optional[Callable[[Dict[str, Any]], bool]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield nodes of a paginated repository connection (e.g. pullRequests).
+
+        Pages are requested only as needed, so a caller that stops iterating
+        early doesn't pay for the rest.
+
+        Args:
+            query: GraphQL query taking $owner, $name, $first and $cursor
+            variables: Other query variables ($owner and $name included)
+            connection: Name of the connection field under repository
+            limit: Maximum number of nodes to yield
+            desc: Progress bar label (no progress bar if None)
+            stop: Predicate on a page's last node; when it holds, no further
+                pages are requested (e.g. the page already reaches a date cutoff)
+
+        Yields:
+            Connection nodes, in the order GitHub returns them
+        """
+        variables = dict(variables, cursor=None)
+        yielded = 0
+        progress = None
+
+        try:
+            while yielded < limit:
+                variables["first"] = min(GRAPHQL_PAGE_SIZE, limit - yielded)
+                repo = self._graphql(query, variables)["repository"]
+                if repo is None:
+                    raise ValueError(f"Repository {variables['owner']}/{variables['name']} not found")
+                page = repo[connection]
+
+                if desc and progress is None:
+                    progress = tqdm(total=min(limit, page["totalCount"]), desc=desc, mininterval=0.5)
+
+                for node in page["nodes"]:
+                    yield node
+                    yielded += 1
+                    if progress is not None:
+                        progress.update()
+
+                if not page["pageInfo"]["hasNextPage"]:
+                    return
+                if stop is not None and page["nodes"] and stop(page["nodes"][-1]):
+                    return
+                variables["cursor"] = page["pageInfo"]["endCursor"]
+        finally:
+            if progress is not None:
+                progress.close()
+
+    def check_repository_changed(self, repo_full_name: str,
+                                 etag: Optional[str] = None) -> Tuple[bool, Optional[str]]:
+        """
+        Conditionally fetch the repository to see if anything changed.
+
+        Sends If-None-Match with a previously stored ETag. GitHub answers
+        304 Not Modified without charging the rate limit when the repository
+        (pushes, stars, open issues/PRs, settings) is unchanged.
+
+        Args:
+            repo_full_name: Repository in format "owner/repo"
+            etag: ETag from the previous check, if any
+
+        Returns:
+            Tuple of (changed, etag). Errors count as changed so callers fall
+            back to a full collection.
+        """
+        headers = {"If-None-Match": etag} if etag else {}
+        try:
+            response = self._request(
+                "GET",
+                REPO_URL.format(repo=repo_full_name),
+                headers=headers,
+                timeout=10
+            )
+        except requests.RequestException as e:
+            print(f"Error checking {repo_full_name} for changes: {e}")
+            return True, etag
+
+        if response.status_code == 304:
+            return False, etag
+        return True, response.headers.get("ETag") if response.ok else etag
+
     def collect_repository_metrics(self, repo_full_name: str) -> Dict[str, Any]:
         """
         Collect basic repository metrics.
@@ -86,30 +651,34 @@ class GitHubCollector:
             Dictionary containing repository metrics
         """
         try:
-            repo = self.github.get_repo(repo_full_name)
+            owner, name = repo_full_name.split("/", 1)
+            repo = self._graphql(REPOSITORY_METRICS_QUERY, {"owner": owner, "name": name})["repository"]
+            if repo is None:
+                raise ValueError(f"Repository {repo_full_name} not found")
 
             return {
-                "name": repo.name,
-                "full_name": repo.full_name,
-                "description": repo.description,
-                "created_at": repo.created_at.isoformat(),
-                "updated_at": repo.updated_at.isoformat(),
-                "pushed_at": repo.pushed_at.isoformat() if repo.pushed_at else None,
-                "size": repo.size,
-                "stargazers_count": repo.stargazers_count,
-                "watchers_count": repo.watchers_count,
-                "forks_count": repo.forks_count,
-                "open_issues_count": repo.get_issues(state='open').totalCount,
-                "language": repo.language,
-                "topics": repo.get_topics(),
-                "has_wiki": repo.has_wiki,
-                "has_pages": repo.has_pages,
-                "has_discussions": repo.has_discussions,
-                "archived": repo.archived,
-                "disabled": repo.disabled,
-                "default_branch": repo.default_branch,
-                "license": repo.license.name if repo.license else None,
-                "collected_at": datetime.now(timezone.utc).isoformat()
+                "name": repo["name"],
+                "full_name": repo["nameWithOwner"],
+                "description": repo["description"],
+                "created_at": _isoformat(repo["createdAt"]),
+                "updated_at": _isoformat(repo["updatedAt"]),
+                "pushed_at": _isoformat(repo["pushedAt"]) if repo["pushedAt"] else None,
+                "size": repo["diskUsage"],
+                # REST watchers_count is the star count (subscribers are separate)
+                "stargazers_count": repo["stargazerCount"],
+                "watchers_count": repo["stargazerCount"],
+                "forks_count": repo["forkCount"],
+                "open_issues_count": repo["issues"]["totalCount"] + repo["pullRequests"]["totalCount"],
+                "language": repo["primaryLanguage"]["name"] if repo["primaryLanguage"] else None,
+                "topics": [n["topic"]["name"] for n in repo["repositoryTopics"]["nodes"]],
+                "has_wiki": repo["hasWikiEnabled"],
+                "has_pages": repo["pagesDeployments"]["totalCount"] > 0,
+                "has_discussions": repo["hasDiscussionsEnabled"],
+                "archived": repo["isArchived"],
+                "disabled": repo["isDisabled"],
+                "default_branch": repo["defaultBranchRef"]["name"] if repo["defaultBranchRef"] else None,
+                "license": repo["licenseInfo"]["name"] if repo["licenseInfo"] else None,
+                "collected_at": datetime.now(timezone.utc).isoformat(timespec="seconds")
             }
         except Exception as e:
             print(f"Error collecting metrics for {repo_full_name}: {e}")
@@ -127,17 +696,17 @@ class GitHubCollector:
             List of contributor dictionaries
         """
         try:
-            repo = self.github.get_repo(repo_full_name)
-            contributors = []
-
-            for contributor in tqdm(repo.get_contributors()[:max_contributors], desc="Contributors"):
-                contributors.append({
-                    "login": contributor.login,
-                    "contributions": contributor.contributions,
-                    "type": contributor.type
-                })
-
-            return contributors
+            return [
+                {
+                    "login": contributor["login"],
+                    "contributions": contributor["contributions"],
+                    "type": contributor["type"]
+                }
+                for contributor in self._get_pages(
+                    CONTRIBUTORS_URL.format(repo=repo_full_name),
+                    max_items=max_contributors
+                )
+            ]
         except Exception as e:
             print(f"Error collecting contributors for {repo_full_name}: {e}")
             return []
@@ -154,36 +723,96 @@ class GitHubCollector:
             List of commit dictionaries
         """
         try:
-            repo = self.github.get_repo(repo_full_name)
-            since_date = datetime.now(timezone.utc) - timedelta(days=since_days)
-            commits = []
-
-            for commit in tqdm(repo.get_commits(since=since_date), desc="Commits"):
-                commits.append({
-                    "sha": commit.sha,
-                    "author": commit.commit.author.name,
-                    "author_login": commit.author.login if commit.author else None,
-                    "date": commit.commit.author.date.isoformat(),
-                    "message": commit.commit.message,
-                    "additions": commit.stats.additions,
-                    "deletions": commit.stats.deletions,
-                    "total_changes": commit.stats.total
-                })
-
-                # Respect rate limits
-                if len(commits) % 100 == 0:
-                    rate_limit = self.get_rate_limit()
-                    if rate_limit["core"]["remaining"] < 100:
-                        wait_time = (rate_limit["core"]["reset"] - datetime.now(timezone.utc)).total_seconds()
-                        if wait_time > 0:
-                            print(f"Rate limit low. Waiting {int(wait_time)} seconds...")
-                            time.sleep(wait_time)
-
-            return commits
+            return list(self.iter_commit_history(repo_full_name, since_days=since_days))
         except Exception as e:
             print(f"Error collecting commits for {repo_full_name}: {e}")
             return []
 
+    def iter_commit_history(self, repo_full_name: str, since_days: int = 365) -> Iterator[Dict[str, Any]]:
+        """
+        Yield recent commits page by page, newest first.
+
+        Only one page of results is held in memory at a time.
+
+        Args:
+            repo_full_name: Repository in format "owner/repo"
+            since_days: Number of days of history to collect
+
+        Yields:
+            Commit dictionaries (same shape as collect_commit_history)
+        """
+        owner, name = repo_full_name.split("/", 1)
+        since_date = datetime.now(timezone.utc) - timedelta(days=since_days)
+        variables = {
+            "owner": owner,
+            "name": name,
+            "since": since_date.isoformat(),
+            "first": COMMIT_PAGE_SIZE,
+            "cursor": None
+        }
+        progress = None
+
+        try:
+            while True:
+                repo = self._graphql(COMMIT_HISTORY_QUERY, variables)["repository"]
+                if repo is None:
+                    raise ValueError(f"Repository {repo_full_name} not found")
+                if repo["defaultBranchRef"] is None:
+                    return  # Empty repository
+                history = repo["defaultBranchRef"]["target"]["history"]
+
+                if progress is None:
+                    # Updated once per page; sections run in parallel, so redraw sparingly
+                    progress = tqdm(total=history["totalCount"], desc="Commits", mininterval=0.5)
+
+                for node in history["nodes"]:
+                    author = node["author"] or {}
+                    yield {
+                        "sha": node["oid"],
+                        "author": author.get("name"),
+                        "author_login": (author.get("user") or {}).get("login"),
+                        "date": _isoformat(author["date"]) if author.get("date") else None,
+                        "message": node["message"],
+                        "additions": node["additions"],
+                        "deletions": node["deletions"],
+                        "total_changes": node["additions"] + node["deletions"]
+                    }
+                progress.update(len(history["nodes"]))
+
+                if not history["pageInfo"]["hasNextPage"]:
+                    return
+                variables["cursor"] = history["pageInfo"]["endCursor"]
+        finally:
+            if progress is not None:
+                progress.close()
+
+    def export_commit_history(self, repo_full_name: str, output_path: Path,
+                              since_days: int = 365) -> int:
+        """
+        Stream recent commits to an NDJSON file (one JSON object per line).
+
+        For very large histories: memory stays at one page of commits instead
+        of the whole list. Read the file back with load_ndjson().
+
+        Args:
+            repo_full_name: Repository in format "owner/repo"
+            output_path: NDJSON file to write
+            since_days: Number of days of history to collect
+
+        Returns:
+            Number of commits written
+        """
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        count = 0
+        with open(output_path, 'wb') as f:
+            for commit in self.iter_commit_history(repo_full_name, since_days=since_days):
+                if orjson is not None:
+                    f.write(orjson.dumps(commit, option=orjson.OPT_APPEND_NEWLINE))
+                else:
+                    f.write(json.dumps(commit).encode("utf-8") + b"\n")
+                count += 1
+        return count
+
     def collect_pull_request_data(self, repo_full_name: str, since_days: int = 365,
                                     max_prs: int = 200) -> Dict[str, Any]:
         """
@@ -198,7 +827,7 @@ class GitHubCollector:
             Dictionary containing PR statistics and samples
         """
         try:
-            repo = self.github.get_repo(repo_full_name)
+            owner, name = repo_full_name.split("/", 1)
             since_date = datetime.now(timezone.utc) - timedelta(days=since_days)
 
             prs_data = {
@@ -217,80 +846,80 @@ class GitHubCollector:
                 }
             }
 
-            # Collect closed/merged PRs
-            closed_prs = repo.get_pulls(state='closed', sort='updated', direction='desc')
+            # Collect closed/merged PRs, most recently updated first
+            closed_prs = self._iter_connection(
+                PULL_REQUESTS_QUERY,
+                {"owner": owner, "name": name, "states": ["CLOSED", "MERGED"], "orderField": "UPDATED_AT"},
+                "pullRequests", limit=max_prs, desc="Collecting PRs",
+                stop=lambda pr: _parse_timestamp(pr["updatedAt"]) < since_date
+            )
             merged_times = []
             closed_times = []
             total_comments = 0
             conflict_count = 0
 
-            for i, pr in enumerate(tqdm(closed_prs, desc="Collecting PRs", total=min(max_prs, closed_prs.totalCount))):
-                if i >= max_prs:
+            for pr in closed_prs:
+                updated_at = _parse_timestamp(pr["updatedAt"])
+                if updated_at < since_date:
                     break
 
-                if pr.updated_at < since_date:
-                    break
+                created_at = _parse_timestamp(pr["createdAt"])
+                comments = pr["comments"]["totalCount"]
+                review_comments = sum(t["comments"]["totalCount"] for t in pr["reviewThreads"]["nodes"])
+                mergeable_state = MERGEABLE_STATES.get(pr["mergeable"], "unknown")
 
                 pr_data = {
-                    "number": pr.number,
-                    "title": pr.title,
-                    "state": pr.state,
-                    "created_at": pr.created_at.isoformat(),
-                    "updated_at": pr.updated_at.isoformat() if pr.updated_at else None,
-                    "closed_at": pr.closed_at.isoformat() if pr.closed_at else None,
-                    "merged_at": pr.merged_at.isoformat() if pr.merged_at else None,
-                    "author": pr.user.login if pr.user else None,
-                    "comments": pr.comments,
-                    "review_comments": pr.review_comments,
-                    "commits": pr.commits,
-                    "additions": pr.additions,
-                    "deletions": pr.deletions,
-                    "changed_files": pr.changed_files,
-                    "mergeable_state": pr.mergeable_state,
-                    "merged": pr.merged
+                    "number": pr["number"],
+                    "title": pr["title"],
+                    "state": "closed",
+                    "created_at": created_at.isoformat(),
+                    "updated_at": updated_at.isoformat(),
+                    "closed_at": _isoformat(pr["closedAt"]) if pr["closedAt"] else None,
+                    "merged_at": _isoformat(pr["mergedAt"]) if pr["mergedAt"] else None,
+                    "author": pr["author"]["login"] if pr["author"] else None,
+                    "comments": comments,
+                    "review_comments": review_comments,
+                    "commits": pr["commits"]["totalCount"],
+                    "additions": pr["additions"],
+                    "deletions": pr["deletions"],
+                    "changed_files": pr["changedFiles"],
+                    "mergeable_state": mergeable_state,
+                    "merged": pr["merged"]
                 }
 
-                total_comments += pr.comments + pr.review_comments
+                total_comments += comments + review_comments
 
                 # Check for merge conflicts
-                if pr.mergeable_state in ['dirty', 'unstable']:
+                if mergeable_state in ['dirty', 'unstable']:
                     conflict_count += 1
 
-                if pr.merged:
+                if pr["merged"]:
                     prs_data["merged"].append(pr_data)
-                    if pr.merged_at and pr.created_at:
-                        merge_time = (pr.merged_at - pr.created_at).total_seconds() / 3600  # hours
+                    if pr["mergedAt"]:
+                        merge_time = (_parse_timestamp(pr["mergedAt"]) - created_at).total_seconds() / 3600  # hours
                         merged_times.append(merge_time)
                 else:
                     prs_data["closed_unmerged"].append(pr_data)
-                    if pr.closed_at and pr.created_at:
-                        close_time = (pr.closed_at - pr.created_at).total_seconds() / 3600  # hours
+                    if pr["closedAt"]:
+                        close_time = (_parse_timestamp(pr["closedAt"]) - created_at).total_seconds() / 3600  # hours
                         closed_times.append(close_time)
 
                 prs_data["statistics"]["total_prs"] += 1
 
-                # Respect rate limits
-                if i % 50 == 0:
-                    rate_limit = self.get_rate_limit()
-                    if rate_limit["core"]["remaining"] < 100:
-                        wait_time = (rate_limit["core"]["reset"] - datetime.now(timezone.utc)).total_seconds()
-                        if wait_time > 0:
-                            print(f"Rate limit low. Waiting {int(wait_time)} seconds...")
-                            time.sleep(wait_time)
-
-            # Collect open PRs (sample)
-            open_prs = repo.get_pulls(state='open', sort='created', direction='desc')
-            for i, pr in enumerate(open_prs):
-                if i >= 50:  # Limit open PRs sample
-                    break
-
+            # Collect open PRs (sample of the 50 newest)
+            open_prs = self._iter_connection(
+                PULL_REQUESTS_QUERY,
+                {"owner": owner, "name": name, "states": ["OPEN"], "orderField": "CREATED_AT"},
+                "pullRequests", limit=50
+            )
+            for pr in open_prs:
                 prs_data["open"].append({
-                    "number": pr.number,
-                    "title": pr.title,
-                    "created_at": pr.created_at.isoformat(),
-                    "author": pr.user.login if pr.user else None,
-                    "comments": pr.comments,
-                    "review_comments": pr.review_comments
+                    "number": pr["number"],
+                    "title": pr["title"],
+                    "created_at": _isoformat(pr["createdAt"]),
+                    "author": pr["author"]["login"] if pr["author"] else None,
+                    "comments": pr["comments"]["totalCount"],
+                    "review_comments": sum(t["comments"]["totalCount"] for t in pr["reviewThreads"]["nodes"])
                 })
 
             # Calculate statistics
@@ -299,9 +928,9 @@ class GitHubCollector:
             prs_data["statistics"]["open_count"] = len(prs_data["open"])
 
             if merged_times:
-                prs_data["statistics"]["avg_time_to_merge"] = sum(merged_times) / len(merged_times)
+                prs_data["statistics"]["avg_time_to_merge"] = fmean(merged_times)
             if closed_times:
-                prs_data["statistics"]["avg_time_to_close"] = sum(closed_times) / len(closed_times)
+                prs_data["statistics"]["avg_time_to_close"] = fmean(closed_times)
             if prs_data["statistics"]["total_prs"] > 0:
                 prs_data["statistics"]["avg_comments_per_pr"] = total_comments / prs_data["statistics"]["total_prs"]
                 prs_data["statistics"]["conflict_rate"] = conflict_count / prs_data["statistics"]["total_prs"]
@@ -326,7 +955,7 @@ class GitHubCollector:
             Dictionary containing issue statistics and samples
         """
         try:
-            repo = self.github.get_repo(repo_full_name)
+            owner, name = repo_full_name.split("/", 1)
             since_date = datetime.now(timezone.utc) - timedelta(days=since_days)
 
             issues_data = {
@@ -344,77 +973,59 @@ class GitHubCollector:
                 }
             }
 
-            # Collect closed issues
-            closed_issues = repo.get_issues(state='closed', since=since_date)
+            # Collect closed issues updated in the period (GraphQL issues exclude PRs)
+            closed_issues = self._iter_connection(
+                ISSUES_QUERY,
+                {"owner": owner, "name": name, "states": ["CLOSED"], "since": since_date.isoformat()},
+                "issues", limit=max_issues, desc="Collecting Issues"
+            )
             closed_times = []
             total_comments = 0
             label_counts = {"bug": 0, "enhancement": 0, "question": 0}
 
-            for i, issue in enumerate(tqdm(closed_issues, desc="Collecting Issues", total=min(max_issues, closed_issues.totalCount))):
-                if i >= max_issues:
-                    break
-
-                # Skip pull requests (GitHub API returns PRs with issues)
-                if issue.pull_request:
-                    continue
-
-                labels = [label.name.lower() for label in issue.labels]
+            for issue in closed_issues:
+                labels = [label["name"].lower() for label in issue["labels"]["nodes"]]
+                comments = issue["comments"]["totalCount"]
 
                 issue_data = {
-                    "number": issue.number,
-                    "title": issue.title,
-                    "state": issue.state,
-                    "created_at": issue.created_at.isoformat(),
-                    "closed_at": issue.closed_at.isoformat() if issue.closed_at else None,
-                    "author": issue.user.login if issue.user else None,
-                    "comments": issue.comments,
+                    "number": issue["number"],
+                    "title": issue["title"],
+                    "state": "closed",
+                    "created_at": _isoformat(issue["createdAt"]),
+                    "closed_at": _isoformat(issue["closedAt"]) if issue["closedAt"] else None,
+                    "author": issue["author"]["login"] if issue["author"] else None,
+                    "comments": comments,
                     "labels": labels
                 }
 
                 issues_data["closed"].append(issue_data)
-                total_comments += issue.comments
-
-                # Categorize by labels
-                if any('bug' in label for label in labels):
-                    label_counts["bug"] += 1
-                if any(term in label for label in labels for term in ['enhancement', 'feature']):
-                    label_counts["enhancement"] += 1
-                if any('question' in label for label in labels):
-                    label_counts["question"] += 1
-
-                if issue.closed_at and issue.created_at:
-                    close_time = (issue.closed_at - issue.created_at).total_seconds() / 3600  # hours
-                    closed_times.append(close_time)
+                total_comments += comments
 
-                issues_data["statistics"]["total_issues"] += 1
+                # Categorize by labels: one scan, each category counted once per issue
+                categories = {LABEL_CATEGORIES[m] for m in LABEL_CATEGORY_RE.findall("\n".join(labels))}
+                for category in categories:
+                    label_counts[category] += 1
 
-                # Respect rate limits
-                if i % 50 == 0:
-                    rate_limit = self.get_rate_limit()
-                    if rate_limit["core"]["remaining"] < 100:
-                        wait_time = (rate_limit["core"]["reset"] - datetime.now(timezone.utc)).total_seconds()
-                        if wait_time > 0:
-                            print(f"Rate limit low. Waiting {int(wait_time)} seconds...")
-                            time.sleep(wait_time)
-
-            # Collect open issues (sample)
-            open_issues = repo.get_issues(state='open', sort='created', direction='desc')
-            for i, issue in enumerate(open_issues):
-                if i >= 50:  # Limit open issues sample
-                    break
+                if issue["closedAt"]:
+                    close_time = (_parse_timestamp(issue["closedAt"]) - _parse_timestamp(issue["createdAt"])).total_seconds() / 3600  # hours
+                    closed_times.append(close_time)
 
-                # Skip pull requests
-                if issue.pull_request:
-                    continue
+                issues_data["statistics"]["total_issues"] += 1
 
-                labels = [label.name.lower() for label in issue.labels]
+            # Collect open issues (sample of the 50 newest)
+            open_issues = self._iter_connection(
+                ISSUES_QUERY,
+                {"owner": owner, "name": name, "states": ["OPEN"], "since": None},
+                "issues", limit=50
+            )
+            for issue in open_issues:
                 issues_data["open"].append({
-                    "number": issue.number,
-                    "title": issue.title,
-                    "created_at": issue.created_at.isoformat(),
-                    "author": issue.user.login if issue.user else None,
-                    "comments": issue.comments,
-                    "labels": labels
+                    "number": issue["number"],
+                    "title": issue["title"],
+                    "created_at": _isoformat(issue["createdAt"]),
+                    "author": issue["author"]["login"] if issue["author"] else None,
+                    "comments": issue["comments"]["totalCount"],
+                    "labels": [label["name"].lower() for label in issue["labels"]["nodes"]]
                 })
 
             # Calculate statistics
@@ -422,7 +1033,7 @@ class GitHubCollector:
             issues_data["statistics"]["open_count"] = len(issues_data["open"])
 
             if closed_times:
-                issues_data["statistics"]["avg_time_to_close"] = sum(closed_times) / len(closed_times)
+                issues_data["statistics"]["avg_time_to_close"] = fmean(closed_times)
             if issues_data["statistics"]["total_issues"] > 0:
                 issues_data["statistics"]["avg_comments_per_issue"] = total_comments / issues_data["statistics"]["total_issues"]
 
@@ -456,30 +1067,29 @@ class GitHubCollector:
         ]
 
         maintainers = set()
-        repo = self.github.get_repo(repo_full_name)
+        # Skip files known to be missing; unchanged ones are 304s served from the cache
+        present = self._existing_files(repo_full_name, maintainer_files)
 
         for file_path in maintainer_files:
+            if present[file_path] is False:
+                continue
             try:
-                content_file = repo.get_contents(file_path)
-                content = content_file.decoded_content.decode('utf-8')
-
-                # Extract GitHub usernames using various patterns:
-                # 1. @username format
-                usernames = re.findall(r'@([a-zA-Z0-9](?:[a-zA-Z0-9]|-(?=[a-zA-Z0-9])){0,38})', content)
-                maintainers.update(usernames)
-
-                # 2. GitHub URLs: https://github.com/username
-                github_urls = re.findall(r'github\.com/([a-zA-Z0-9](?:[a-zA-Z0-9]|-(?=[a-zA-Z0-9])){0,38})(?:/|\s|$)', content)
-                maintainers.update(github_urls)
-
-                # 3. Markdown links: [Name](https://github.com/username)
-                markdown_links = re.findall(r'\[.*?\]\(https?://github\.com/([a-zA-Z0-9](?:[a-zA-Z0-9]|-(?=[a-zA-Z0-9])){0,38})\)', content)
-                maintainers.update(markdown_links)
+                response = self._request(
+                    "GET",
+                    CONTENTS_URL.format(repo=repo_full_name, path=file_path),
+                    timeout=10
+                )
+                response.raise_for_status()
+                content = base64.b64decode(_parse_json(response)["content"]).decode('utf-8')
+
+                # One scan per file for both username forms
+                for match in MAINTAINER_RE.finditer(content):
+                    maintainers.add(match.group('at') or match.group('url'))
 
                 print(f"Found {len(maintainers)} maintainers in {file_path}")
 
             except Exception as e:
-                # File doesn't exist or can't be read, continue
+                # File can't be read, continue
                 continue
 
         # Filter out common false positives
@@ -500,7 +1110,7 @@ class GitHubCollector:
             Dictionary with maintainer information
         """
         try:
-            repo = self.github.get_repo(repo_full_name)
+            repo = self._repo(repo_full_name)
 
             maintainer_data = {
                 "collaborators": [],
@@ -516,12 +1126,14 @@ class GitHubCollector:
 
             # Get collaborators (those with push access)
             try:
-                collaborators = repo.get_collaborators()
-                for collab in collaborators:
-                    maintainer_data["collaborators"].append({
-                        "login": collab.login,
-                        "permissions": collab.permissions.__dict__ if hasattr(collab, 'permissions') else {}
-                    })
+                # The listing includes each collaborator's permissions inline
+                maintainer_data["collaborators"] = [
+                    {
+                        "login": collab["login"],
+                        "permissions": collab.get("permissions", {})
+                    }
+                    for collab in self._get_pages(COLLABORATORS_URL.format(repo=repo_full_name))
+                ]
                 maintainer_data["statistics"]["total_collaborators"] = len(maintainer_data["collaborators"])
             except Exception as e:
                 print(f"Could not fetch collaborators (requires admin access): {e}")
@@ -550,24 +1162,22 @@ class GitHubCollector:
 
             # Get top committers from recent activity (proxy for active maintainers)
             since_date = datetime.now(timezone.utc) - timedelta(days=180)  # 6 months
-            commit_authors = {}
+            commit_authors = Counter()
 
             try:
                 commits = repo.get_commits(since=since_date)
                 for commit in commits:
                     if commit.author:
-                        login = commit.author.login
-                        commit_authors[login] = commit_authors.get(login, 0) + 1
+                        commit_authors[commit.author.login] += 1
 
-                # Sort by commit count
-                sorted_authors = sorted(commit_authors.items(), key=lambda x: x[1], reverse=True)
+                # most_common(n) selects with a heap rather than sorting everyone
                 maintainer_data["top_committers"] = [
                     {"login": author, "commits_6mo": count}
-                    for author, count in sorted_authors[:10]
+                    for author, count in commit_authors.most_common(10)
                 ]
-                maintainer_data["statistics"]["active_maintainers_6mo"] = len([
-                    a for a, c in sorted_authors if c >= 5  # At least 5 commits in 6 months
-                ])
+                maintainer_data["statistics"]["active_maintainers_6mo"] = sum(
+                    1 for c in commit_authors.values() if c >= 5  # At least 5 commits in 6 months
+                )
             except Exception as e:
                 print(f"Could not analyze committers: {e}")
 
@@ -577,7 +1187,7 @@ class GitHubCollector:
             print(f"Error collecting maintainer data for {repo_full_name}: {e}")
             return {"error": str(e)}
 
-    def check_governance_files(self, repo_full_name: str) -> Dict[str, bool]:
+    def check_governance_files(self, repo_full_name: str) -> Dict[str, Optional[bool]]:
         """
         Check for presence of governance-related files.
 
@@ -585,7 +1195,8 @@ class GitHubCollector:
             repo_full_name: Repository in format "owner/repo"
 
         Returns:
-            Dictionary indicating presence of governance files
+            Dictionary indicating presence of governance files (None if the
+            check failed, e.g. on a server error)
         """
         governance_files = [
             "GOVERNANCE.md",
@@ -596,34 +1207,126 @@ class GitHubCollector:
             ".github/CODEOWNERS"
         ]
 
-        results = {}
-        repo = self.github.get_repo(repo_full_name)
+        present = self._existing_files(repo_full_name, governance_files)
+        return {f: present[f] for f in governance_files}
 
-        for file_path in governance_files:
-            try:
-                repo.get_contents(file_path)
-                results[file_path] = True
-            except:
-                results[file_path] = False
+    def _existing_files(self, repo_full_name: str, paths: List[str]) -> Dict[str, Optional[bool]]:
+        """
+        Find which of the given paths exist on the default branch.
 
-        return results
+        Uses one directory listing per parent directory instead of one request
+        per file (the root first, so subdirectories it lacks cost nothing).
 
-    def save_data(self, data: Dict[str, Any], output_path: Path):
-        """Save collected data to JSON file."""
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        Args:
+            repo_full_name: Repository in format "owner/repo"
+            paths: File paths relative to the repository root
 
-        def json_serializer(obj):
-            """Custom JSON serializer for non-serializable objects."""
-            if hasattr(obj, '__dict__'):
-                return str(obj)
-            if hasattr(obj, 'isoformat'):
-                return obj.isoformat()
-            return str(obj)
+        Returns:
+            Dictionary mapping each path to whether it exists, or None if its
+            directory could not be listed
+        """
+        listings: Dict[str, Optional[set]] = {}
+        for directory in sorted({posixpath.dirname(p) for p in paths}):
+            root = listings.get("")
+            if directory and root is not None and directory.split("/")[0] not in root:
+                listings[directory] = set()
+            else:
+                listings[directory] = self._list_directory(repo_full_name, directory)
+
+        result: Dict[str, Optional[bool]] = {}
+        for path in paths:
+            listing = listings[posixpath.dirname(path)]
+            result[path] = None if listing is None else posixpath.basename(path) in listing
+        return result
+
+    def _list_directory(self, repo_full_name: str, directory: str = "") -> Optional[set]:
+        """
+        Get the entry names of a directory on the default branch.
 
-        with open(output_path, 'w') as f:
-            json.dump(data, f, indent=2, default=json_serializer)
-        print(f"Data saved to {output_path}")
+        Args:
+            repo_full_name: Repository in format "owner/repo"
+            directory: Path relative to the repository root ("" for the root)
+
+        Returns:
+            Set of file and directory names (empty if the directory is missing),
+            or None if it could not be listed
+        """
+        try:
+            response = self._request(
+                "GET",
+                CONTENTS_URL.format(repo=repo_full_name, path=directory),
+                timeout=10
+            )
+        except requests.RequestException as e:
+            print(f"⚠️  Could not list {repo_full_name}/{directory}: {e}")
+            return None
+
+        if response.status_code == 404:
+            return set()
+        if response.status_code != 200:
+            # Still failing after retries; unknown, not missing
+            print(f"⚠️  Could not list {repo_full_name}/{directory}: HTTP {response.status_code}")
+            return None
+        entries = _parse_json(response)
+        if not isinstance(entries, list):
+            # The path is a file, not a directory
+            return set()
+        return {entry["name"] for entry in entries}
+
+    @staticmethod
+    def serialize_data(data: Dict[str, Any]) -> bytes:
+        """
+        Serialize collected data to indented JSON bytes.
 
+        Uses orjson when installed (several times faster on large datasets),
+        falling back to the standard library json module.
+        """
+        if orjson is not None:
+            return orjson.dumps(
+                data,
+                default=_json_serializer,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        return json.dumps(data, indent=2, default=_json_serializer).encode("utf-8")
+
+    @staticmethod
+    def load_data(input_path: Path) -> Dict[str, Any]:
+        """Load previously saved data, using orjson when installed."""
+        raw = Path(input_path).read_bytes()
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw)
+
+    @staticmethod
+    def load_ndjson(input_path: Path) -> Iterator[Dict[str, Any]]:
+        """Lazily read records written by export_commit_history()."""
+        loads = orjson.loads if orjson is not None else json.loads
+        with open(input_path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield loads(line)
+
+    @staticmethod
+    def write_data(payload: bytes, output_path: Path) -> None:
+        """
+        Write serialized data to disk. Safe to run in a worker thread.
+
+        Writes to a temp file and renames it over output_path, so an interrupted
+        run never leaves a truncated data file behind.
+        """
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = output_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            temp_path.write_bytes(payload)
+            os.replace(temp_path, output_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+    def save_data(self, data: Dict[str, Any], output_path: Path):
+        """Save collected data to JSON file."""
+        self.write_data(self.serialize_data(data), output_path)
+        print(f"Data saved to {output_path}")
 
     def collect_complete_dataset(self, repo_full_name: str, since_days: int = 365) -> Dict[str, Any]:
         """
@@ -643,38 +1346,30 @@ class GitHubCollector:
         data = {
             "metadata": {
                 "repo": repo_full_name,
-                "collected_at": datetime.now(timezone.utc).isoformat(),
+                "collected_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
                 "collection_period_days": since_days
             }
         }
 
-        # Basic repository metrics
-        print("1/7 Collecting repository metrics...")
-        data["repository"] = self.collect_repository_metrics(repo_full_name)
-
-        # Maintainer identification
-        print("2/7 Identifying maintainers...")
-        data["maintainers"] = self.collect_maintainer_data(repo_full_name)
-
-        # Contributors
-        print("3/7 Collecting contributor data...")
-        data["contributors"] = self.collect_contributor_data(repo_full_name, max_contributors=100)
-
-        # Commits
-        print("4/7 Collecting commit history...")
-        data["recent_commits"] = self.collect_commit_history(repo_full_name, since_days=since_days)
-
-        # Pull requests
-        print("5/7 Collecting pull request data...")
-        data["pull_requests"] = self.collect_pull_request_data(repo_full_name, since_days=since_days)
+        # Sections are independent, so their requests overlap
+        sections = [
+            ("repository", "repository metrics", self.collect_repository_metrics, {}),
+            ("maintainers", "maintainer data", self.collect_maintainer_data, {}),
+            ("contributors", "contributor data", self.collect_contributor_data, {"max_contributors": 100}),
+            ("recent_commits", "commit history", self.collect_commit_history, {"since_days": since_days}),
+            ("pull_requests", "pull request data", self.collect_pull_request_data, {"since_days": since_days}),
+            ("issues", "issue data", self.collect_issue_data, {"since_days": since_days}),
+            ("governance_files", "governance files", self.check_governance_files, {}),
+        ]
 
-        # Issues
-        print("6/7 Collecting issue data...")
-        data["issues"] = self.collect_issue_data(repo_full_name, since_days=since_days)
+        with ThreadPoolExecutor(max_workers=SECTION_WORKERS) as executor:
+            futures = []
+            for i, (key, label, collect, kwargs) in enumerate(sections, 1):
+                print(f"{i}/{len(sections)} Collecting {label}...")
+                futures.append((key, executor.submit(collect, repo_full_name, **kwargs)))
 
-        # Governance files
-        print("7/7 Checking governance files...")
-        data["governance_files"] = self.check_governance_files(repo_full_name)
+            for key, future in futures:
+                data[key] = future.result()
 
         print(f"\n{'='*60}")
         print(f"Collection complete for: {repo_full_name}")
@@ -683,31 +1378,12 @@ class GitHubCollector:
         return data
 
 
-def main():
-    """Example usage - collect data for a Stadium project."""
-    import argparse
-
-    parser = argparse.ArgumentParser(description='Collect GitHub data for OSS projects')
-    parser.add_argument('repo', help='Repository in format owner/repo (e.g., curl/curl)')
-    parser.add_argument('--days', type=int, default=365, help='Days of history to collect (default: 365)')
-    parser.add_argument('--output-dir', default='data/raw', help='Output directory (default: data/raw)')
-
-    args = parser.parse_args()
-
-    collector = GitHubCollector()
-
-    # Collect complete dataset
-    data = collector.collect_complete_dataset(args.repo, since_days=args.days)
-
-    # Save data
-    output_path = Path(args.output_dir) / f"{args.repo.replace('/', '_')}_data.json"
-    collector.save_data(data, output_path)
-
-    # Print summary
+def _print_summary(repo: str, data: Dict[str, Any], output_path: Path) -> None:
+    """Print the collection summary for one repository."""
     print("\n" + "="*60)
     print("COLLECTION SUMMARY")
     print("="*60)
-    print(f"Repository: {args.repo}")
+    print(f"Repository: {repo}")
     print(f"Stars: {data['repository'].get('stargazers_count', 'N/A')}")
     print(f"Forks: {data['repository'].get('forks_count', 'N/A')}")
     print(f"Language: {data['repository'].get('language', 'N/A')}")
@@ -735,10 +1411,67 @@ def main():
         print("  - None found")
 
     print(f"\nData saved to: {output_path}")
+
+
+def main():
+    """Example usage - collect data for one or more projects."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Collect GitHub data for OSS projects')
+    parser.add_argument('repos', nargs='*', metavar='repo',
+                        help='Repository in format owner/repo (e.g., curl/curl); several may be given')
+    parser.add_argument('--repos-file', type=Path,
+                        help='File with one owner/repo per line (blank lines and # comments ignored)')
+    parser.add_argument('--days', type=int, default=365, help='Days of history to collect (default: 365)')
+    parser.add_argument('--output-dir', default='data/raw', help='Output directory (default: data/raw)')
+
+    args = parser.parse_args()
+
+    repos = list(args.repos)
+    if args.repos_file:
+        with open(args.repos_file, 'r') as f:
+            repos.extend(
+                line.strip() for line in f
+                if line.strip() and not line.lstrip().startswith('#')
+            )
+    if not repos:
+        parser.error("give at least one repository or --repos-file")
+
+    # With several tokens (GITHUB_TOKENS), repositories are spread across them
+    # round-robin, skipping tokens that are already exhausted
+    pool = TokenPool()
+    pool.refresh_all()
+    collectors: Dict[str, GitHubCollector] = {}
+
+    def collect(repo: str, collector: GitHubCollector) -> Tuple[Dict[str, Any], Path]:
+        data = collector.collect_complete_dataset(repo, since_days=args.days)
+        output_path = Path(args.output_dir) / f"{repo.replace('/', '_')}_data.json"
+        collector.save_data(data, output_path)
+        return data, output_path
+
+    # Repositories are independent, so several are collected at once
+    with ThreadPoolExecutor(max_workers=min(len(repos), REPO_WORKERS)) as executor:
+        futures = []
+        for repo in repos:
+            token = pool.next_token()
+            if token not in collectors:
+                collectors[token] = GitHubCollector(token)
+            futures.append((repo, executor.submit(collect, repo, collectors[token])))
+
+        for repo, future in futures:
+            try:
+                data, output_path = future.result()
+            except Exception as e:
+                print(f"\n❌ Failed to collect {repo}: {e}")
+                continue
+            _print_summary(repo, data, output_path)
+
+    # Taken from the last response headers, so no extra /rate_limit calls
     print(f"\nRate limit status:")
-    rate_limit = collector.get_rate_limit()
-    print(f"  - Core: {rate_limit['core']['remaining']}/{rate_limit['core']['limit']}")
-    print(f"  - Reset: {rate_limit['core']['reset']}")
+    for collector in collectors.values():
+        remaining, reset_at = collector.get_last_rate_limit()
+        print(f"  - Core remaining: {remaining}")
+        print(f"  - Reset: {reset_at}")
     print("="*60)
 
 
@@ -5,6 +5,7 @@ Wraps token pool with smart waiting and progress display.
 
 import time
 import sys
+import threading
 from datetime import datetime, timezone
 from typing import Optional, Callable, Any
 from dataclasses import dataclass
@@ -20,6 +21,7 @@ class RateLimitConfig:
     wait_buffer_seconds: int = 60  # Extra seconds after reset
     progress_update_interval: int = 30  # Seconds between progress updates during wait
     max_wait_time: int = 3700  # Max seconds to wait (slightly over 1 hour)
+    refresh_ttl_seconds: int = 10  # Reuse limits checked or reported this recently
 
 
 class RateLimiter:
@@ -54,20 +56,51 @@ class RateLimiter:
         self.on_wait_start = on_wait_start
         self.on_wait_complete = on_wait_complete
 
-        self._interrupted = False
+        # Set by interrupt(); waits block on it so they end immediately
+        self._stop_event = threading.Event()
 
-    def can_collect(self, refresh: bool = True) -> bool:
+    def refresh(self, token: Optional[str] = None, force: bool = False) -> None:
+        """
+        Refresh rate limits from the API, skipping tokens that are still fresh.
+
+        Limits reported from response headers (report_actual) count as fresh,
+        so a busy collection loop rarely needs a /rate_limit call.
+
+        Args:
+            token: Only refresh this token. If None, refreshes the whole pool.
+            force: Refresh even if checked within refresh_ttl_seconds.
+        """
+        if token is None:
+            if force:
+                self.pool.refresh_all()
+            else:
+                self.pool.refresh_stale(self.config.refresh_ttl_seconds)
+            return
+
+        token_info = self.pool.get_token_info(token)
+        if token_info is not None and (force or not token_info.is_fresh(self.config.refresh_ttl_seconds)):
+            self.pool.refresh_token(token)
+
+    def can_collect(self, refresh: bool = True, token: Optional[str] = None) -> bool:
         """
         Check if we have enough remaining calls to collect a project.
 
         Args:
-            refresh: If True, refresh rate limits from API first.
+            refresh: If True, refresh stale rate limits from API first.
+            token: Only consider this token's budget (for per-token workers).
+                If None, the pool's total remaining calls are used.
 
         Returns:
             True if collection can proceed, False if should wait.
         """
+        if token is not None:
+            if refresh:
+                self.refresh(token)
+            token_info = self.pool.get_token_info(token)
+            return token_info is not None and token_info.remaining >= self.config.min_remaining
+
         if refresh:
-            self.pool.refresh_all()
+            self.refresh()
 
         return self.pool.get_total_remaining() >= self.config.min_remaining
 
@@ -77,13 +110,13 @@ class RateLimiter:
 
         Args:
             n: Number of projects to collect
-            refresh: If True, refresh rate limits first
+            refresh: If True, refresh stale rate limits first
 
         Returns:
             True if enough calls remain
         """
         if refresh:
-            self.pool.refresh_all()
+            self.refresh()
 
         needed = n * self.config.calls_per_project_estimate
         return self.pool.get_total_remaining() >= needed
@@ -118,7 +151,15 @@ class RateLimiter:
         Returns:
             True if wait completed, False if interrupted
         """
-        self._interrupted = False
+        self._stop_event.clear()
+
+        # A token whose reset time has passed is likely usable again, but its
+        # stored count is from before the reset; check it rather than wait
+        for token_info in self.pool.tokens:
+            if (token_info.reset_at and token_info.seconds_until_reset() == 0
+                    and not token_info.is_available(self.pool.min_remaining)):
+                self.pool.refresh_token(token_info.token)
+
         wait_time = self.pool.get_wait_time()
 
         if wait_time <= 0:
@@ -133,7 +174,8 @@ class RateLimiter:
         if interactive:
             return self._interactive_wait(wait_time)
         else:
-            time.sleep(wait_time)
+            if self._stop_event.wait(wait_time):
+                return False
             if self.on_wait_complete:
                 self.on_wait_complete()
             return True
@@ -148,36 +190,49 @@ class RateLimiter:
         Returns:
             True if completed, False if interrupted
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         end_time = start_time + wait_time
+        is_tty = sys.stdout.isatty()
 
         print(f"\n⏳ Rate limit reached. Waiting {wait_time/60:.0f} minutes...")
         print("   Press Ctrl+C to stop and save progress.\n")
 
         try:
-            while time.time() < end_time and not self._interrupted:
-                elapsed = time.time() - start_time
-                remaining = wait_time - elapsed
+            while time.monotonic() < end_time and not self._stop_event.is_set():
+                elapsed = time.monotonic() - start_time
+                remaining = max(0, wait_time - elapsed)
                 progress = elapsed / wait_time * 100
 
                 # Format time remaining
                 mins = int(remaining // 60)
                 secs = int(remaining % 60)
 
-                # Create progress bar
-                bar_width = 30
-                filled = int(bar_width * progress / 100)
-                bar = "█" * filled + "░" * (bar_width - filled)
-
-                # Print progress (overwrite line)
-                sys.stdout.write(f"\r   [{bar}] {progress:.0f}% - {mins}m {secs}s remaining")
-                sys.stdout.flush()
-
-                time.sleep(min(1, remaining))
-
-            print()  # New line after progress
-
-            if self._interrupted:
+                if is_tty:
+                    # Create progress bar
+                    bar_width = 30
+                    filled = int(bar_width * progress / 100)
+                    bar = "█" * filled + "░" * (bar_width - filled)
+
+                    # Print progress (overwrite line)
+                    sys.stdout.write(f"\r   [{bar}] {progress:.0f}% - {mins}m {secs}s remaining")
+                    sys.stdout.flush()
+                else:
+                    # Redirected to a log: one plain line per update, no redraws
+                    print(f"   {progress:.0f}% - {mins}m {secs}s remaining")
+
+                # Redraw less often while the reset is far off; interrupt() wakes us at once
+                if remaining > 60 or not is_tty:
+                    interval = self.config.progress_update_interval
+                elif remaining > 10:
+                    interval = 5
+                else:
+                    interval = 1
+                self._stop_event.wait(min(interval, remaining))
+
+            if is_tty:
+                print()  # New line after progress
+
+            if self._stop_event.is_set():
                 print("   ⚠️  Wait interrupted by user")
                 return False
 
@@ -189,12 +244,12 @@ class RateLimiter:
 
         except KeyboardInterrupt:
             print("\n   ⚠️  Wait interrupted by user")
-            self._interrupted = True
+            self._stop_event.set()
             return False
 
     def interrupt(self) -> None:
         """Signal to interrupt waiting."""
-        self._interrupted = True
+        self._stop_event.set()
 
     def ensure_can_collect(self, interactive: bool = True) -> bool:
         """
@@ -222,6 +277,17 @@ class RateLimiter:
         if token:
             self.pool.decrement_remaining(token, calls_made)
 
+    def report_actual(self, token: str, remaining: int, reset_at: Optional[datetime] = None) -> None:
+        """
+        Record the exact remaining calls for a token, as reported by GitHub.
+
+        Args:
+            token: Token the calls were made with
+            remaining: X-RateLimit-Remaining from the latest response
+            reset_at: X-RateLimit-Reset from the latest response
+        """
+        self.pool.update_remaining(token, remaining, reset_at)
+
     def get_status(self) -> dict:
         """Get comprehensive status."""
         return {
@@ -238,7 +304,7 @@ class RateLimiter:
 
     def print_status(self) -> None:
         """Print human-readable status."""
-        self.pool.refresh_all()
+        self.refresh()
 
         print("\n" + "=" * 50)
         print("RATE LIMIT STATUS")
@@ -0,0 +1,99 @@
+"""
+Disk-backed HTTP Response Cache for GitHub API Requests
+Stores ETag-validated response bodies so repeated runs can use conditional GETs.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Any
+
+
+class ResponseCache:
+    """
+    Caches GET response bodies on disk, keyed by URL.
+
+    GitHub answers a conditional GET (If-None-Match with a stored ETag) with
+    304 Not Modified when nothing changed, and 304s don't count against the
+    primary rate limit. Each entry is one JSON file:
+
+    {
+        "url": "https://api.github.com/...",
+        "etag": "W/\"...\"",
+        "body": "<response text>"
+    }
+    """
+
+    DEFAULT_CACHE_DIR = Path("data/cache/http")
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Initialize response cache.
+
+        Args:
+            cache_dir: Directory for cache entries. Defaults to data/cache/http
+        """
+        self.cache_dir = cache_dir or self.DEFAULT_CACHE_DIR
+
+    def _entry_path(self, url: str) -> Path:
+        """Get the file holding the entry for a URL."""
+        return self.cache_dir / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Entry dict with "etag" and "body", or None if not cached
+        """
+        try:
+            with open(self._entry_path(url), 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        # Guard against (unlikely) hash collisions
+        return entry if entry.get("url") == url else None
+
+    def put(self, url: str, etag: str, body: str) -> None:
+        """
+        Store a response body with its ETag.
+
+        Written to a temp file and renamed, so concurrent readers never see a
+        partial entry.
+
+        Args:
+            url: Request URL
+            etag: ETag header of the response
+            body: Response text
+        """
+        path = self._entry_path(url)
+        temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, 'w') as f:
+                json.dump({"url": url, "etag": etag, "body": body}, f)
+            os.replace(temp_path, path)
+        except OSError as e:
+            # A cache that can't be written just means no cache hits
+            print(f"⚠️  Could not cache response for {url}: {e}")
+            temp_path.unlink(missing_ok=True)
+
+    def clear(self) -> int:
+        """
+        Delete all cache entries.
+
+        Returns:
+            Number of entries deleted
+        """
+        removed = 0
+        if self.cache_dir.is_dir():
+            for path in self.cache_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
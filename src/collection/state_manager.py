@@ -5,11 +5,21 @@ Provides JSON-based state persistence for resumable batch collection.
 
 import json
 import os
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set
 from dataclasses import dataclass, asdict
-import shutil
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # Windows: no state locking
 
 
 @dataclass
@@ -26,7 +36,7 @@ class CollectionState:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'CollectionState':
         return cls(
-            pending=data.get("pending", []),
+            pending=list(data.get("pending", [])),
             in_progress=data.get("in_progress"),
             completed=data.get("completed", []),
             failed=data.get("failed", [])
@@ -37,6 +47,16 @@ class StateManager:
     """
     Manages collection state with atomic file operations.
 
+    Queue transitions (start/complete/fail/retry) are appended to a write-ahead
+    log next to the state file (collection_state.wal), one JSON line per change.
+    The full state file is only rewritten once SNAPSHOT_EVERY changes have
+    accumulated, or for other updates (initialize, add, statistics).
+    Loading replays the log entries newer than the snapshot's wal_seq.
+
+    The first change takes an exclusive lock (collection_state.lock) that is held
+    until the process exits, so a second process can read the state but can't
+    overwrite changes it hasn't seen.
+
     State file format:
     {
         "queue": {
@@ -49,7 +69,8 @@ class StateManager:
             "created_at": "iso timestamp",
             "updated_at": "iso timestamp",
             "category": "stadium",
-            "total_projects": 70
+            "total_projects": 70,
+            "wal_seq": 0
         },
         "statistics": {
             "api_calls_total": 0,
@@ -60,28 +81,174 @@ class StateManager:
 
     DEFAULT_STATE_PATH = Path("data/collection_state.json")
 
-    def __init__(self, state_path: Optional[Path] = None):
+    # Rewrite the full state file once the log holds this many changes
+    SNAPSHOT_EVERY = 50
+
+    def __init__(self, state_path: Optional[Path] = None, flush_every: int = 1):
         """
         Initialize state manager.
 
         Args:
             state_path: Path to state file. Defaults to data/collection_state.json
+            flush_every: Log queue transitions to disk every N finished projects.
+                1 writes on every change; larger values batch writes, so after a
+                crash up to N-1 projects may be collected again.
         """
         self.state_path = state_path or self.DEFAULT_STATE_PATH
+        self.wal_path = self.state_path.with_suffix('.wal')
+        self.lock_path = self.state_path.with_suffix('.lock')
+        self._lock_file = None
+        self.flush_every = max(1, flush_every)
         self._state: Optional[Dict[str, Any]] = None
+        self._known: Optional[Set[str]] = None  # Every queued project; see _known_projects()
+        self._unlogged: List[Dict[str, Any]] = []  # Applied but not yet in the log
+        self._logged_ops = 0  # Log entries since the last snapshot
+        self._unflushed_projects = 0
+
+    def _acquire_lock(self) -> None:
+        """
+        Take the exclusive state lock before the first change.
+
+        State read before the lock was taken is reloaded, in case another
+        process changed it in the meantime.
+
+        Raises:
+            RuntimeError: If another process holds the lock
+        """
+        if self._lock_file is not None or fcntl is None:
+            return
+
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        lock_file = open(self.lock_path, 'w')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            raise RuntimeError(
+                f"State file {self.state_path} is in use by another process. "
+                f"Stop it before changing the queue."
+            )
+        self._lock_file = lock_file
+
+        if self._state is not None:
+            self.refresh()
+
+    def _holds_lock(self) -> bool:
+        """Check whether this manager may change the files on disk."""
+        return self._lock_file is not None or fcntl is None
+
+    def close(self) -> None:
+        """Write batched changes and release the state lock."""
+        self.flush()
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
 
     def _load_state(self) -> Dict[str, Any]:
         """Load state from file, creating default if doesn't exist."""
         if self.state_path.exists():
-            with open(self.state_path, 'r') as f:
-                return json.load(f)
-        return self._default_state()
+            raw = self.state_path.read_bytes()
+            state = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            # Taken from the front on every get_next(); a deque makes that O(1)
+            state["queue"]["pending"] = deque(state["queue"]["pending"])
+        else:
+            state = self._default_state()
+
+        self._logged_ops = self._replay_wal(state)
+        return state
+
+    def _replay_wal(self, state: Dict[str, Any]) -> int:
+        """
+        Apply logged changes that are newer than the loaded snapshot.
+
+        Args:
+            state: State loaded from the snapshot file (modified in place)
+
+        Returns:
+            Number of log entries applied
+        """
+        if not self.wal_path.exists():
+            return 0
+
+        applied = 0
+        complete_end = 0  # Offset just past the last newline-terminated line
+        with open(self.wal_path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Last line cut short by a crash mid-append
+                    break
+                complete_end += len(line)
+                try:
+                    op = json.loads(line)
+                except ValueError:
+                    # A torn line that was ended before later appends; skip it
+                    continue
+                # Entries up to wal_seq are already in the snapshot (a crash can
+                # land between writing the snapshot and removing the log)
+                if op["seq"] > state["metadata"].get("wal_seq", 0):
+                    self._apply(state, op)
+                    applied += 1
+
+        # Drop a torn tail, so the next append doesn't extend the broken line.
+        # Only with the lock: otherwise the tail may be another process mid-append.
+        if complete_end < self.wal_path.stat().st_size and self._holds_lock():
+            with open(self.wal_path, 'r+b') as f:
+                f.truncate(complete_end)
+        return applied
+
+    @staticmethod
+    def _apply(state: Dict[str, Any], op: Dict[str, Any]) -> None:
+        """
+        Apply one logged change to the state.
+
+        Args:
+            state: State dictionary (modified in place)
+            op: Log entry with "op", "seq", "timestamp" and op-specific fields
+                ("repo", and "error" for failures)
+        """
+        queue = state["queue"]
+        repo = op.get("repo")
+
+        if op["op"] == "start":
+            if queue["pending"][0] == repo:
+                queue["pending"].popleft()
+            else:
+                queue["pending"].remove(repo)
+            queue["in_progress"] = repo
+
+        elif op["op"] in ("complete", "fail"):
+            if queue["in_progress"] == repo:
+                queue["in_progress"] = None
+            elif repo in queue["pending"]:
+                # Handed out by peek_next()
+                queue["pending"].remove(repo)
+
+            if op["op"] == "complete":
+                if repo not in queue["completed"]:
+                    queue["completed"].append(repo)
+                state["statistics"]["collections_completed"] += 1
+            else:
+                # A project can fail after being marked completed (e.g. its data write failed)
+                if repo in queue["completed"]:
+                    queue["completed"].remove(repo)
+                queue["failed"].append({
+                    "repo": repo,
+                    "error": op["error"],
+                    "timestamp": op["timestamp"]
+                })
+
+        elif op["op"] == "retry":
+            queue["pending"].extend(f["repo"] for f in queue["failed"])
+            queue["failed"] = []
+
+        state["metadata"]["wal_seq"] = op["seq"]
+        state["metadata"]["updated_at"] = op["timestamp"]
 
     def _default_state(self) -> Dict[str, Any]:
         """Create default empty state."""
         return {
             "queue": {
-                "pending": [],
+                "pending": deque(),
                 "in_progress": None,
                 "completed": [],
                 "failed": []
@@ -90,7 +257,8 @@ class StateManager:
                 "created_at": datetime.now(timezone.utc).isoformat(),
                 "updated_at": datetime.now(timezone.utc).isoformat(),
                 "category": None,
-                "total_projects": 0
+                "total_projects": 0,
+                "wal_seq": 0
             },
             "statistics": {
                 "api_calls_total": 0,
@@ -103,30 +271,90 @@ class StateManager:
         """
         Save state atomically using write-then-rename pattern.
         This prevents corruption if interrupted during write.
+
+        The snapshot includes every logged change, so the log is emptied.
         """
         state["metadata"]["updated_at"] = datetime.now(timezone.utc).isoformat()
 
         # Ensure directory exists
         self.state_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write to temp file then rename (atomic on POSIX)
+        # Write to temp file then rename (atomic on POSIX and Windows)
+        # Kept indented: the state file is meant to be read (and diffed) by people.
+        # default=list converts the pending deque.
         temp_path = self.state_path.with_suffix('.tmp')
-        with open(temp_path, 'w') as f:
-            json.dump(state, f, indent=2)
+        with open(temp_path, 'wb') as f:
+            if orjson is not None:
+                f.write(orjson.dumps(state, default=list, option=orjson.OPT_INDENT_2))
+            else:
+                f.write(json.dumps(state, indent=2, default=list).encode("utf-8"))
 
         # Atomic rename
-        shutil.move(str(temp_path), str(self.state_path))
+        os.replace(temp_path, self.state_path)
+        self.wal_path.unlink(missing_ok=True)
+        self._unlogged = []
+        self._logged_ops = 0
+        self._unflushed_projects = 0
+
+    def _commit(self, op: Dict[str, Any], finishes_project: bool = False) -> None:
+        """
+        Apply a change and log it, batching writes when flush_every > 1.
+
+        Args:
+            op: Log entry with "op" and op-specific fields (seq and timestamp
+                are filled in here)
+            finishes_project: True for completed/failed transitions, which count
+                towards flush_every. Other transitions ride along with the next flush.
+        """
+        self._acquire_lock()
+        state = self.state
+        op["seq"] = state["metadata"].get("wal_seq", 0) + 1
+        op["timestamp"] = datetime.now(timezone.utc).isoformat()
+        self._apply(state, op)
+        self._unlogged.append(op)
+        if self._known is not None and "repo" in op:
+            # Transitions only move projects between lists, except failing an unqueued one
+            self._known.add(op["repo"])
+
+        if finishes_project:
+            self._unflushed_projects += 1
+        if self.flush_every <= 1 or self._unflushed_projects >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write any batched state changes to disk."""
+        if not self._unlogged or self._state is None:
+            return
+
+        if self._logged_ops + len(self._unlogged) >= self.SNAPSHOT_EVERY:
+            self._save_state(self._state)
+            return
+
+        self.wal_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.wal_path, 'a+b') as f:
+            # Always start on a fresh line, even after a torn append
+            lines = "".join(json.dumps(op) + "\n" for op in self._unlogged)
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    lines = "\n" + lines
+            f.write(lines.encode("utf-8"))
+        self._logged_ops += len(self._unlogged)
+        self._unlogged = []
+        self._unflushed_projects = 0
 
     @property
     def state(self) -> Dict[str, Any]:
         """Get current state (lazy loaded)."""
         if self._state is None:
             self._state = self._load_state()
+            self._known = None
         return self._state
 
     def refresh(self) -> None:
         """Force reload state from disk."""
         self._state = self._load_state()
+        self._known = None
 
     def initialize(self, projects: List[str], category: str) -> None:
         """
@@ -136,7 +364,10 @@ class StateManager:
             projects: List of repo strings in "owner/repo" format
             category: Category name (stadium, federation, club, toy)
         """
+        self._acquire_lock()
+
         # Check if there's existing state with in-progress work
+        wal_seq = 0
         if self.state_path.exists():
             existing = self._load_state()
             if existing["queue"]["in_progress"] or existing["queue"]["pending"]:
@@ -145,17 +376,36 @@ class StateManager:
                     f"and in_progress={existing['queue']['in_progress']}. "
                     f"Use 'resume' or delete state file first."
                 )
+            # Keep numbering past the old log, in case it outlives this snapshot
+            wal_seq = existing["metadata"].get("wal_seq", 0)
 
         state = self._default_state()
-        state["queue"]["pending"] = projects
+        state["metadata"]["wal_seq"] = wal_seq
+        state["queue"]["pending"] = deque(projects)
         state["metadata"]["category"] = category
         state["metadata"]["total_projects"] = len(projects)
 
         self._save_state(state)
         self._state = state
+        self._known = None
 
         print(f"✅ Initialized queue with {len(projects)} projects for category '{category}'")
 
+    def _known_projects(self) -> Set[str]:
+        """
+        Get every project in any part of the queue.
+
+        Built once per loaded state and kept up to date by add_projects() and
+        _commit(), so repeated adds don't rescan the whole queue.
+        """
+        if self._known is None:
+            queue = self.state["queue"]
+            self._known = set(queue["pending"]) | set(queue["completed"])
+            self._known |= {f["repo"] for f in queue["failed"]}
+            if queue["in_progress"]:
+                self._known.add(queue["in_progress"])
+        return self._known
+
     def add_projects(self, projects: List[str], skip_existing: bool = True) -> int:
         """
         Add projects to the pending queue.
@@ -167,19 +417,18 @@ class StateManager:
         Returns:
             Number of projects actually added
         """
+        self._acquire_lock()
         state = self.state
-        existing = set(state["queue"]["pending"]) | set(state["queue"]["completed"])
-        existing |= {f["repo"] for f in state["queue"]["failed"]}
-        if state["queue"]["in_progress"]:
-            existing.add(state["queue"]["in_progress"])
+        existing = self._known_projects()
 
-        added = 0
-        for project in projects:
-            if skip_existing and project in existing:
-                continue
-            state["queue"]["pending"].append(project)
-            existing.add(project)
-            added += 1
+        if skip_existing:
+            # dict.fromkeys drops repeats within the input, keeping order
+            new_projects = [p for p in dict.fromkeys(projects) if p not in existing]
+        else:
+            new_projects = list(projects)
+        state["queue"]["pending"].extend(new_projects)
+        existing.update(new_projects)
+        added = len(new_projects)
 
         state["metadata"]["total_projects"] = (
             len(state["queue"]["pending"]) +
@@ -198,6 +447,7 @@ class StateManager:
         Returns:
             Next project repo string, or None if queue is empty
         """
+        self._acquire_lock()
         state = self.state
 
         # If something is already in progress, return it
@@ -208,29 +458,43 @@ class StateManager:
         if not state["queue"]["pending"]:
             return None
 
-        next_project = state["queue"]["pending"].pop(0)
-        state["queue"]["in_progress"] = next_project
-
-        self._save_state(state)
+        next_project = state["queue"]["pending"][0]
+        self._commit({"op": "start", "repo": next_project})
         return next_project
 
-    def mark_completed(self, repo: str) -> None:
+    def peek_next(self, exclude: Optional[Set[str]] = None) -> Optional[str]:
         """
-        Mark a project as successfully collected.
+        Get next project to collect without taking it off the queue.
+
+        Used by parallel collection: a project stays pending until it is marked
+        completed or failed, so an interrupted run collects it again.
 
         Args:
-            repo: Repository string that was collected
+            exclude: Projects already being collected by other workers
+
+        Returns:
+            Next project repo string, or None if nothing is left to hand out
         """
         state = self.state
+        exclude = exclude or set()
 
-        if state["queue"]["in_progress"] == repo:
-            state["queue"]["in_progress"] = None
+        in_progress = state["queue"]["in_progress"]
+        if in_progress and in_progress not in exclude:
+            return in_progress
 
-        if repo not in state["queue"]["completed"]:
-            state["queue"]["completed"].append(repo)
+        for project in state["queue"]["pending"]:
+            if project not in exclude:
+                return project
+        return None
 
-        state["statistics"]["collections_completed"] += 1
-        self._save_state(state)
+    def mark_completed(self, repo: str) -> None:
+        """
+        Mark a project as successfully collected.
+
+        Args:
+            repo: Repository string that was collected
+        """
+        self._commit({"op": "complete", "repo": repo}, finishes_project=True)
 
     def mark_failed(self, repo: str, error: str) -> None:
         """
@@ -240,18 +504,7 @@ class StateManager:
             repo: Repository string that failed
             error: Error message
         """
-        state = self.state
-
-        if state["queue"]["in_progress"] == repo:
-            state["queue"]["in_progress"] = None
-
-        state["queue"]["failed"].append({
-            "repo": repo,
-            "error": error,
-            "timestamp": datetime.now(timezone.utc).isoformat()
-        })
-
-        self._save_state(state)
+        self._commit({"op": "fail", "repo": repo, "error": error}, finishes_project=True)
 
     def retry_failed(self) -> int:
         """
@@ -260,21 +513,22 @@ class StateManager:
         Returns:
             Number of projects moved to pending
         """
-        state = self.state
+        self._acquire_lock()
+        retried = len(self.state["queue"]["failed"])
 
-        failed_repos = [f["repo"] for f in state["queue"]["failed"]]
-        state["queue"]["pending"].extend(failed_repos)
-        state["queue"]["failed"] = []
-
-        self._save_state(state)
-        return len(failed_repos)
+        # One log line rather than rewriting the whole queue
+        self._commit({"op": "retry"})
+        self.flush()
+        return retried
 
     def update_statistics(self, api_calls: int = 0, duration_sec: float = 0) -> None:
         """Update collection statistics."""
+        self._acquire_lock()
         state = self.state
         state["statistics"]["api_calls_total"] += api_calls
         if duration_sec > 0:
             state["statistics"]["last_collection_duration_sec"] = duration_sec
+        # Called once at the end of a run, so this also compacts the log
         self._save_state(state)
 
     def get_status(self) -> Dict[str, Any]:
@@ -311,9 +565,16 @@ class StateManager:
 
     def clear(self) -> None:
         """Clear all state (delete state file)."""
+        self._acquire_lock()
+
+        # The log first: on its own it would be replayed onto a fresh state
+        self.wal_path.unlink(missing_ok=True)
         if self.state_path.exists():
             os.remove(self.state_path)
         self._state = None
+        self._known = None
+        self._unlogged = []
+        self._logged_ops = 0
         print(f"✅ Cleared state file: {self.state_path}")
 
 
@@ -321,10 +582,9 @@ def main():
     """Test state manager functionality."""
     import tempfile
 
-    with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
-        test_path = Path(f.name)
-
-    try:
+    # The manager keeps its .wal and .lock files next to the state file
+    with tempfile.TemporaryDirectory() as temp_dir:
+        test_path = Path(temp_dir) / "collection_state.json"
         manager = StateManager(test_path)
 
         # Initialize
@@ -352,9 +612,6 @@ def main():
         print(f"\nRetried {retried} failed projects")
         print(manager.get_status())
 
-    finally:
-        test_path.unlink(missing_ok=True)
-
 
 if __name__ == "__main__":
     main()
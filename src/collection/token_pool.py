@@ -3,12 +3,24 @@ Token Pool Manager for GitHub API Rate Limit Handling
 Manages multiple GitHub tokens for increased throughput and automatic rotation.
 """
 
+import logging
 import os
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_URL = "https://api.github.com/rate_limit"
 
 
 @dataclass
@@ -20,11 +32,18 @@ class TokenInfo:
     limit: int = 5000
     reset_at: Optional[datetime] = None
     last_checked: Optional[datetime] = None
+    etag: Optional[str] = None  # Of the last /rate_limit response, for conditional checks
 
     def is_available(self, min_remaining: int = 100) -> bool:
         """Check if token has enough remaining calls."""
         return self.remaining >= min_remaining
 
+    def is_fresh(self, max_age: float) -> bool:
+        """Check if the limits were checked or updated within max_age seconds."""
+        if not self.last_checked:
+            return False
+        return (datetime.now(timezone.utc) - self.last_checked).total_seconds() < max_age
+
     def seconds_until_reset(self) -> float:
         """Get seconds until rate limit resets."""
         if not self.reset_at:
@@ -53,6 +72,11 @@ class TokenPool:
     - Wait time calculation when all tokens exhausted
     """
 
+    # get_best_token() reuses limits checked (or updated) this recently
+    REFRESH_TTL_SECONDS = 30
+    # ...or this recently, when a token has at least 10x min_remaining left
+    AMPLE_BUDGET_TTL_SECONDS = 300
+
     def __init__(
         self,
         tokens: Optional[List[str]] = None,
@@ -86,6 +110,19 @@ class TokenPool:
                 "No GitHub tokens found. Set GITHUB_TOKEN or GITHUB_TOKENS environment variable."
             )
 
+        # Token string -> TokenInfo, for lookups after every project
+        self._by_token: Dict[str, TokenInfo] = {}
+        for token_info in self.tokens:
+            self._by_token.setdefault(token_info.token, token_info)
+
+        # One keep-alive connection pool for all rate limit checks
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(
+            pool_maxsize=max(4, len(self.tokens)),
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        ))
+        self._session.headers.update({"Accept": "application/vnd.github.v3+json"})
+
         print(f"✅ Token pool initialized with {len(self.tokens)} token(s)")
 
     def _load_from_env(self) -> List[str]:
@@ -112,49 +149,105 @@ class TokenPool:
         Args:
             token_info: TokenInfo object to update
         """
+        headers = {"Authorization": f"token {token_info.token}"}
+        if token_info.etag:
+            headers["If-None-Match"] = token_info.etag
+
         try:
-            response = requests.get(
-                "https://api.github.com/rate_limit",
-                headers={
-                    "Authorization": f"token {token_info.token}",
-                    "Accept": "application/vnd.github.v3+json"
-                },
-                timeout=10
-            )
+            response = self._session.get(RATE_LIMIT_URL, headers=headers, timeout=10)
 
-            if response.status_code == 200:
-                data = response.json()
+            if response.status_code == 304:
+                # Limits unchanged since the last check; nothing to parse
+                token_info.last_checked = datetime.now(timezone.utc)
+
+            elif response.status_code == 200:
+                data = orjson.loads(response.content) if orjson is not None else response.json()
                 core = data["resources"]["core"]
 
-                token_info.remaining = core["remaining"]
-                token_info.limit = core["limit"]
-                token_info.reset_at = datetime.fromtimestamp(core["reset"], tz=timezone.utc)
-                token_info.last_checked = datetime.now(timezone.utc)
+                self._set_limits(token_info, core["remaining"], core["limit"],
+                                 datetime.fromtimestamp(core["reset"], tz=timezone.utc))
+                token_info.etag = response.headers.get("ETag")
 
             elif response.status_code == 401:
-                print(f"⚠️  Token {token_info.token_id} is invalid or expired")
+                logger.warning("⚠️  Token %s is invalid or expired", token_info.token_id)
                 token_info.remaining = 0
+                token_info.etag = None
             else:
-                print(f"⚠️  Rate limit check failed for {token_info.token_id}: {response.status_code}")
+                logger.warning("⚠️  Rate limit check failed for %s: %s", token_info.token_id, response.status_code)
 
         except Exception as e:
-            print(f"⚠️  Error checking rate limit for {token_info.token_id}: {e}")
+            logger.warning("⚠️  Error checking rate limit for %s: %s", token_info.token_id, e)
+
+    def close(self) -> None:
+        """Close the pooled HTTP connections."""
+        self._session.close()
+
+    def get_token_info(self, token: str) -> Optional[TokenInfo]:
+        """
+        Look up the TokenInfo for a token string.
+
+        Args:
+            token: Token string
+
+        Returns:
+            TokenInfo, or None if the token is not in the pool
+        """
+        return self._by_token.get(token)
+
+    def refresh_token(self, token: str) -> None:
+        """Check the rate limit for a single token."""
+        token_info = self.get_token_info(token)
+        if token_info:
+            self._check_rate_limit(token_info)
 
     def refresh_all(self) -> None:
         """Check rate limits for all tokens."""
-        for token_info in self.tokens:
-            self._check_rate_limit(token_info)
-            time.sleep(0.1)  # Small delay between checks
+        self._check_all(self.tokens)
 
-    def get_best_token(self) -> Optional[Tuple[str, TokenInfo]]:
+    def refresh_stale(self, max_age: float) -> None:
+        """
+        Check rate limits for tokens not checked or updated recently.
+
+        Args:
+            max_age: Seconds after which a token's stored limits count as stale
+        """
+        stale = [t for t in self.tokens if not t.is_fresh(max_age)]
+        if stale:
+            self._check_all(stale)
+
+    def _check_all(self, token_infos: List[TokenInfo]) -> None:
+        """Check rate limits for several tokens."""
+        # Each check only touches its own TokenInfo, so they can run at once
+        with ThreadPoolExecutor(max_workers=min(8, len(token_infos))) as executor:
+            list(executor.map(self._check_rate_limit, token_infos))
+
+    def get_best_token(self, force_refresh: bool = False) -> Optional[Tuple[str, TokenInfo]]:
         """
         Get the token with the most remaining API calls.
 
+        If a token checked within AMPLE_BUDGET_TTL_SECONDS has at least
+        10x min_remaining left, it is returned without checking the others.
+
+        Args:
+            force_refresh: Check every token's limits, even ones checked or
+                updated within REFRESH_TTL_SECONDS
+
         Returns:
             Tuple of (token_string, TokenInfo) or None if all exhausted
         """
+        if not force_refresh:
+            # Plenty left on a recently checked token: no need to probe the others
+            fresh = [t for t in self.tokens if t.is_fresh(self.AMPLE_BUDGET_TTL_SECONDS)]
+            if fresh:
+                cached = max(fresh, key=lambda t: t.remaining)
+                if cached.remaining >= self.min_remaining * 10:
+                    return (cached.token, cached)
+
         # Refresh rate limits
-        self.refresh_all()
+        if force_refresh:
+            self.refresh_all()
+        else:
+            self.refresh_stale(self.REFRESH_TTL_SECONDS)
 
         # Sort by remaining calls (descending)
         available = [t for t in self.tokens if t.is_available(self.min_remaining)]
@@ -175,6 +268,28 @@ class TokenPool:
         result = self.get_best_token()
         return result[0] if result else None
 
+    def next_token(self) -> str:
+        """
+        Get the next token in round-robin order, skipping exhausted ones.
+
+        Uses the last known remaining counts (no API calls), so it is cheap
+        enough to call per project.
+
+        Returns:
+            Token string. If every token is below min_remaining, the next one
+            in order is returned anyway.
+        """
+        count = len(self.tokens)
+        for offset in range(count):
+            index = (self._current_index + offset) % count
+            if self.tokens[index].is_available(self.min_remaining):
+                break
+        else:
+            index = self._current_index
+
+        self._current_index = (index + 1) % count
+        return self.tokens[index].token
+
     def get_any_token(self) -> str:
         """
         Get any token (even if rate limited).
@@ -195,13 +310,22 @@ class TokenPool:
             remaining: New remaining count
             reset_at: Optional new reset time
         """
-        for token_info in self.tokens:
-            if token_info.token == token:
-                token_info.remaining = remaining
-                if reset_at:
-                    token_info.reset_at = reset_at
-                token_info.last_checked = datetime.now(timezone.utc)
-                break
+        token_info = self._by_token.get(token)
+        if token_info:
+            self._set_limits(token_info, remaining, reset_at=reset_at)
+
+    @staticmethod
+    def _set_limits(token_info: TokenInfo, remaining: int, limit: Optional[int] = None,
+                    reset_at: Optional[datetime] = None) -> None:
+        """Store exact limits for a token and mark them as just checked."""
+        # Stored limits no longer match the last /rate_limit body, so a 304 can't vouch for them
+        token_info.etag = None
+        token_info.remaining = remaining
+        if limit is not None:
+            token_info.limit = limit
+        if reset_at:
+            token_info.reset_at = reset_at
+        token_info.last_checked = datetime.now(timezone.utc)
 
     def decrement_remaining(self, token: str, count: int = 1) -> None:
         """
@@ -211,10 +335,10 @@ class TokenPool:
             token: Token string used
             count: Number of calls made
         """
-        for token_info in self.tokens:
-            if token_info.token == token:
-                token_info.remaining = max(0, token_info.remaining - count)
-                break
+        token_info = self._by_token.get(token)
+        if token_info:
+            token_info.remaining = max(0, token_info.remaining - count)
+            token_info.etag = None
 
     def get_wait_time(self) -> float:
         """
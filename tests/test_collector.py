@@ -0,0 +1,217 @@
+"""
+Tests for collection state and update merging.
+"""
+
+import json
+import os
+import signal
+
+import pytest
+from src.collection.collector_daemon import CollectorDaemon
+from src.collection.state_manager import StateManager
+
+
+class TestStateManagerLog:
+    """Test suite for StateManager's write-ahead log of queue changes."""
+
+    @pytest.fixture(autouse=True)
+    def setup_state(self, tmp_path):
+        """Set up a state file path in a temporary directory."""
+        self.state_path = tmp_path / "collection_state.json"
+        self.managers = []
+        yield
+        for manager in self.managers:
+            manager.close()
+
+    def open_manager(self) -> StateManager:
+        """Open the state like a newly started process would."""
+        for manager in self.managers:
+            manager.close()
+        manager = StateManager(self.state_path)
+        self.managers.append(manager)
+        return manager
+
+    def collect_next(self, manager: StateManager) -> str:
+        """Take the next project off the queue and mark it completed."""
+        project = manager.get_next()
+        manager.mark_completed(project)
+        return project
+
+    def read_snapshot(self) -> dict:
+        """Read the state file without replaying the log."""
+        return json.loads(self.state_path.read_text())
+
+    def test_replay_after_restart(self):
+        """Test logged changes survive a restart without a new snapshot."""
+        manager = self.open_manager()
+        manager.initialize(["a/a", "b/b", "c/c"], "stadium")
+        self.collect_next(manager)
+        manager.mark_failed(manager.get_next(), "boom")
+
+        # Only the log has the changes
+        assert self.read_snapshot()["queue"]["completed"] == []
+        assert manager.wal_path.exists()
+
+        queue = self.open_manager().state["queue"]
+        assert list(queue["pending"]) == ["c/c"]
+        assert queue["in_progress"] is None
+        assert queue["completed"] == ["a/a"]
+        assert [f["repo"] for f in queue["failed"]] == ["b/b"]
+
+    def test_truncated_last_line(self):
+        """Test a line torn by a crash doesn't hide changes logged after the restart."""
+        manager = self.open_manager()
+        manager.initialize(["a/a", "b/b", "c/c"], "stadium")
+        self.collect_next(manager)
+        manager.close()
+
+        # Crash while appending "complete a/a": the start entry survives
+        os.truncate(manager.wal_path, manager.wal_path.stat().st_size - 10)
+
+        manager = self.open_manager()
+        assert manager.state["queue"]["in_progress"] == "a/a"
+        assert self.collect_next(manager) == "a/a"
+        assert self.collect_next(manager) == "b/b"
+
+        queue = self.open_manager().state["queue"]
+        assert queue["completed"] == ["a/a", "b/b"]
+        assert list(queue["pending"]) == ["c/c"]
+
+    def test_torn_line_before_later_appends(self):
+        """Test appends after a torn line that wasn't truncated start on a new line."""
+        manager = self.open_manager()
+        manager.initialize(["a/a", "b/b"], "stadium")
+        self.collect_next(manager)
+
+        # Torn entry left behind while this manager already had the state loaded
+        with open(manager.wal_path, 'a') as f:
+            f.write('{"op": "comp')
+        self.collect_next(manager)
+
+        queue = self.open_manager().state["queue"]
+        assert queue["completed"] == ["a/a", "b/b"]
+        assert list(queue["pending"]) == []
+
+    def test_entries_in_snapshot_are_skipped(self):
+        """Test log entries up to the snapshot's wal_seq are not applied twice."""
+        manager = self.open_manager()
+        manager.initialize(["a/a", "b/b", "c/c"], "stadium")
+        self.collect_next(manager)
+        self.collect_next(manager)
+        log = manager.wal_path.read_bytes()
+
+        # Crash after writing the snapshot but before removing the log
+        manager.update_statistics(api_calls=700, duration_sec=1.0)
+        assert self.read_snapshot()["metadata"]["wal_seq"] == 4
+        manager.wal_path.write_bytes(log)
+
+        state = self.open_manager().state
+        assert state["queue"]["completed"] == ["a/a", "b/b"]
+        assert list(state["queue"]["pending"]) == ["c/c"]
+        assert state["statistics"]["collections_completed"] == 2
+
+    def test_compaction(self):
+        """Test the log is folded into the state file after SNAPSHOT_EVERY changes."""
+        manager = self.open_manager()
+        manager.SNAPSHOT_EVERY = 4
+        manager.initialize(["a/a", "b/b", "c/c"], "stadium")
+
+        self.collect_next(manager)
+        assert manager.wal_path.exists()
+
+        # Changes 3 and 4 reach the threshold
+        self.collect_next(manager)
+        assert not manager.wal_path.exists()
+        snapshot = self.read_snapshot()
+        assert snapshot["queue"]["completed"] == ["a/a", "b/b"]
+        assert snapshot["metadata"]["wal_seq"] == 4
+
+        # Logging resumes after the snapshot
+        self.collect_next(manager)
+        assert manager.wal_path.exists()
+        assert self.open_manager().state["queue"]["completed"] == ["a/a", "b/b", "c/c"]
+
+
+class TestUpdateMerge:
+    """Test suite for merging update deltas into collected data."""
+
+    @pytest.fixture(autouse=True)
+    def setup_daemon(self, tmp_path):
+        """Set up a daemon with its state in a temporary directory."""
+        # The daemon installs its own shutdown handlers; put pytest's back afterwards
+        handlers = {sig: signal.getsignal(sig) for sig in (signal.SIGINT, signal.SIGTERM)}
+        self.daemon = CollectorDaemon(state_path=tmp_path / "state.json", output_dir=tmp_path / "raw")
+        yield
+        for sig, handler in handlers.items():
+            signal.signal(sig, handler)
+
+    @staticmethod
+    def existing_data() -> dict:
+        """Previously collected data for one project."""
+        return {
+            "metadata": {"repo": "o/r", "collected_at": "2025-01-01T00:00:00+00:00"},
+            "repository": {"stargazers_count": 10, "collected_at": "2025-01-01T00:00:00+00:00"},
+            "contributors": [
+                {"login": "a", "contributions": 10},
+                {"login": "b", "contributions": 5},
+                {"login": "c", "contributions": 1}
+            ],
+            "recent_commits": [{"sha": "s2"}, {"sha": "s1"}]
+        }
+
+    def test_unseen_commits_drops_duplicates(self):
+        """Test delta commits already on disk or repeated in the delta are dropped."""
+        delta = {"recent_commits": [{"sha": "s4"}, {"sha": "s3"}, {"sha": "s4"}, {"sha": "s2"}]}
+
+        unseen = CollectorDaemon._unseen_commits(self.existing_data(), delta)
+
+        assert [c["sha"] for c in unseen] == ["s4", "s3"]
+
+    def test_merge_prepends_unseen_commits(self):
+        """Test new commits go first, without duplicating known ones."""
+        delta = {"recent_commits": [{"sha": "s3"}, {"sha": "s3"}, {"sha": "s2"}]}
+
+        merged = self.daemon._merge_delta(self.existing_data(), delta)
+
+        assert [c["sha"] for c in merged["recent_commits"]] == ["s3", "s2", "s1"]
+
+    def test_empty_delta_when_only_collected_at_changed(self):
+        """Test a delta that only moves collection timestamps counts as empty."""
+        existing = self.existing_data()
+        delta = {
+            "repository": {"stargazers_count": 10, "collected_at": "2025-02-01T00:00:00+00:00"},
+            "contributors": [{"login": "a", "contributions": 10}],
+            "recent_commits": [{"sha": "s2"}]
+        }
+        unseen = CollectorDaemon._unseen_commits(existing, delta)
+
+        assert CollectorDaemon._is_empty_delta(existing, delta, unseen)
+
+        delta["repository"]["stargazers_count"] = 11
+        assert not CollectorDaemon._is_empty_delta(existing, delta, unseen)
+
+    def test_merge_resorts_changed_contributors(self):
+        """Test changed or new contributor counts re-sort the contributor list."""
+        delta = {"contributors": [
+            {"login": "c", "contributions": 20},
+            {"login": "d", "contributions": 7}
+        ]}
+
+        merged = self.daemon._merge_delta(self.existing_data(), delta)
+
+        assert [(c["login"], c["contributions"]) for c in merged["contributors"]] == [
+            ("c", 20), ("a", 10), ("d", 7), ("b", 5)
+        ]
+
+    def test_merge_keeps_unchanged_contributor_prefix(self):
+        """Test a delta repeating the leading contributors leaves the list as it was."""
+        existing = self.existing_data()
+        expected = [dict(c) for c in existing["contributors"]]
+        delta = {"contributors": [
+            {"login": "a", "contributions": 10},
+            {"login": "b", "contributions": 5}
+        ]}
+
+        merged = self.daemon._merge_delta(existing, delta)
+
+        assert merged["contributors"] == expected
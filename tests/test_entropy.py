@@ -75,3 +75,131 @@ class TestEntropyCalculator:
         """Test entropy normalization with zero maximum."""
         normalized = self.calculator.calculate_normalized_entropy(1.0, 0.0)
         assert normalized == 0.0
+
+    def test_commit_temporal_entropy_skips_malformed_dates(self):
+        """Test temporal entropy ignores commits without a valid ISO date."""
+        commits = [
+            {"date": "2024-01-15T09:30:00Z"},
+            {"date": "2024-01-16T21:05:00+00:00"},
+            {"date": None},
+            {"date": "not a date"},
+            {}
+        ]
+        entropy = self.calculator.commit_temporal_entropy(commits)
+
+        # Two valid commits in different hours: log2(2) = 1.0
+        assert np.isclose(entropy, 1.0, rtol=1e-5)
+
+    def test_calculate_all_entropy_measures_matches_individual(self):
+        """Test fused commit pass agrees with the standalone measures."""
+        commits = [
+            {"date": "2024-01-15T09:30:00Z", "additions": 5, "deletions": 2},
+            {"date": "2024-01-15T14:00:00Z", "additions": 120, "deletions": 30},
+            {"date": "2024-01-16T14:10:00Z", "additions": 2000, "deletions": 0},
+            {"additions": 40, "deletions": 5}
+        ]
+        measures = self.calculator.calculate_all_entropy_measures({"recent_commits": commits})
+
+        assert np.isclose(measures["temporal_entropy"],
+                          self.calculator.commit_temporal_entropy(commits))
+        assert np.isclose(measures["change_entropy"],
+                          self.calculator.file_change_entropy(commits))
+
+    def test_gini_coefficient_equal(self):
+        """Test Gini coefficient with equal contributions."""
+        gini = self.calculator.gini_coefficient([10, 10, 10, 10])
+        assert np.isclose(gini, 0.0, atol=1e-9)
+
+    def test_gini_coefficient_unequal(self):
+        """Test Gini coefficient against a hand-computed value."""
+        # G = 2 * (1*1 + 2*2 + 3*3 + 4*4) / (4 * 10) - 5/4 = 0.25
+        gini = self.calculator.gini_coefficient([4, 1, 3, 2])
+        assert np.isclose(gini, 0.25, rtol=1e-9)
+
+    def test_contributor_entropy_matches_shannon(self):
+        """Test count-based contributor entropy equals Shannon entropy of shares."""
+        counts = [500, 200, 100, 50, 10, 0]
+        contributors = [{"login": f"user{i}", "contributions": c} for i, c in enumerate(counts)]
+        entropy, normalized = self.calculator.contributor_entropy(contributors)
+
+        expected = self.calculator.shannon_entropy(np.array(counts) / sum(counts))
+        assert np.isclose(entropy, expected, rtol=1e-9)
+        assert np.isclose(normalized, expected / np.log2(len(counts)), rtol=1e-9)
+
+    def test_classify_project_stadium(self):
+        """Test a single dominant contributor is classified as Stadium."""
+        contributors = [{"login": "maintainer", "contributions": 5000}]
+        contributors += [{"login": f"user{i}", "contributions": 1} for i in range(19)]
+        result = self.calculator.classify_project(contributors)
+
+        assert result["classification"] == "Stadium (Strong)"
+        assert result["stadium_score"] == 3
+        assert np.isclose(result["metrics"]["gini_coefficient"],
+                          self.calculator.gini_coefficient([c["contributions"] for c in contributors]))
+
+    def test_classify_project_ignores_input_order(self):
+        """Test top contributor shares don't depend on contributor ordering."""
+        contributors = [
+            {"login": "user1", "contributions": 10},
+            {"login": "user2", "contributions": 70},
+            {"login": "user3", "contributions": 20}
+        ]
+        result = self.calculator.classify_project(contributors)
+
+        assert np.isclose(result["metrics"]["top_contributor_pct"], 70.0)
+        assert np.isclose(result["metrics"]["top_2_contributors_pct"], 90.0)
+
+    def test_classify_projects_matches_single(self):
+        """Test batched classification agrees with per-project classification."""
+        projects = [
+            [{"login": "a", "contributions": c} for c in [5000, 3, 2, 1, 1, 1, 1, 1, 1, 1]],
+            [{"login": "b", "contributions": c} for c in [100, 90, 80, 70, 60]],
+            [{"login": "c", "contributions": 0}, {"login": "d", "contributions": 12}],
+            [{"login": "e", "contributions": 0}],
+            []
+        ]
+        batch = self.calculator.classify_projects(projects)
+
+        assert len(batch) == len(projects)
+        for contributors, result in zip(projects, batch):
+            expected = self.calculator.classify_project(contributors)
+            assert result["classification"] == expected["classification"]
+            for key, value in expected["metrics"].items():
+                assert np.isclose(result["metrics"][key], value)
+
+    def test_classify_projects_all_empty(self):
+        """Test batched classification of projects without contributors."""
+        batch = self.calculator.classify_projects([[], []])
+
+        assert batch == [self.calculator.classify_project([])] * 2
+
+    def test_classify_projects_empty_and_nonempty(self):
+        """Test empty projects don't shift top contributor shares of their neighbours."""
+        projects = [
+            [],
+            [{"login": "a", "contributions": 90}, {"login": "b", "contributions": 10}],
+            [],
+            [{"login": "c", "contributions": 7}]
+        ]
+        batch = self.calculator.classify_projects(projects)
+
+        for contributors, result in zip(projects, batch):
+            expected = self.calculator.classify_project(contributors)
+            assert result["classification"] == expected["classification"]
+            for key, value in expected.get("metrics", {}).items():
+                assert np.isclose(result["metrics"][key], value)
+        assert np.isclose(batch[1]["metrics"]["top_contributor_pct"], 90.0)
+
+    def test_is_stadium_candidate_matches_classification(self):
+        """Test the quick Stadium screen agrees with the full classification."""
+        rng = np.random.default_rng(0)
+        projects = [
+            [{"login": str(i), "contributions": int(c)} for i, c in enumerate(counts)]
+            for counts in (rng.pareto(a, size=n) * 10 for a, n in
+                           [(0.5, 20), (1.0, 50), (3.0, 10), (0.8, 3), (5.0, 100)])
+        ]
+        projects.append([{"login": "solo", "contributions": 42}])
+        for contributors in projects:
+            expected = self.calculator.classify_project(contributors).get("stadium_score", 0) >= 2
+            assert self.calculator.is_stadium_candidate(contributors) == expected
+        assert not self.calculator.is_stadium_candidate([])